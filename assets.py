@@ -0,0 +1,160 @@
+"""Bundling, minification and content-hash fingerprinting of the site's JS and CSS
+
+Every page loads one stylesheet and one script bundle. Bundle file names carry
+a hash of their contents, so a bundle can be cached forever: any edit to its
+sources produces a new name, and the pages referencing it are rebuilt.
+"""
+import hashlib
+import os
+import re
+
+ASSETS_DIR = 'assets'
+# Sources are read next to this file, whatever the working directory
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bundle name -> source files, concatenated in order
+BUNDLES = {
+    'style.css': ['style.css'],
+    # Leaderboard, shard-loading and player pages
+    'page.js': ['js/tablesort.min.js', 'js/tablesort.number.min.js', 'js/tablesort.date.js', 'js/pagination.js',
+                'js/sorting-logic.js', 'js/theme-toggle.js', 'js/tablesort-init.js'],
+    # --client-render shells; leaderboard-data.js makes its tables sortable once they are filled
+    'shell.js': ['js/tablesort.min.js', 'js/tablesort.number.min.js', 'js/tablesort.date.js', 'js/sorting-logic.js',
+                 'js/leaderboard-data.js', 'js/theme-toggle.js'],
+    'index.js': ['js/tablesort.min.js', 'js/tablesort.number.min.js', 'js/tablesort.date.js', 'js/theme-toggle.js',
+                 'js/sidebar-menu.js', 'js/tablesort-init.js'],
+}
+
+# name -> (fingerprinted file name, contents), filled on first use
+_built = {}
+
+_CSS_TOKENS = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|/\*.*?\*/)''', re.S)
+
+def _minify_css_code(code):
+    code = re.sub(r'\s+', ' ', code)
+    code = re.sub(r' ?([{},;>]) ?', r'\1', code)
+    return code.replace(': ', ':').replace(';}', '}')
+
+def minify_css(source):
+    """Drop comments and the whitespace CSS does not need, leaving strings untouched"""
+    out = []
+    code = []
+    for i, part in enumerate(_CSS_TOKENS.split(source)):
+        if i % 2 == 0:
+            code.append(part)
+        elif part.startswith('/*'):
+            code.append(' ')
+        else:
+            out.append(_minify_css_code(''.join(code)))
+            out.append(part)
+            code = []
+    out.append(_minify_css_code(''.join(code)))
+    return ''.join(out).strip()
+
+# After these characters or keywords a slash starts a regular expression rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'instanceof', 'new', 'void', 'delete', 'throw'}
+# Whitespace next to these characters is never significant
+_JS_PUNCTUATION = set('{}()[];,:=<>?!&|%^~')
+
+def _skip_quoted(source, i, quote):
+    """Index just past the string, template or regex literal opened at source[i]"""
+    i += 1
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if quote == '/' and char in '[]':
+            in_class = char == '['
+        elif char == quote and not in_class:
+            return i + 1
+        i += 1
+    return i
+
+def minify_js(source):
+    """Drop comments (except /*! licence headers), indentation and blank lines
+
+    Line breaks are kept so automatic semicolon insertion behaves as in the source.
+    """
+    out = []
+    previous = ''
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = len(source) if end < 0 else end + 2
+            if source.startswith('/*!', i):
+                out.append(source[i:end] + '\n')
+                previous = '\n'
+            i = end
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = len(source) if end < 0 else end
+        elif char.isspace():
+            end = i
+            while end < len(source) and source[end].isspace():
+                end += 1
+            following = source[end:end + 1]
+            if out and following:
+                if '\n' in source[i:end]:
+                    if out[-1] == ' ':
+                        out.pop()
+                    if previous != '\n':
+                        out.append('\n')
+                        previous = '\n'
+                elif previous not in _JS_PUNCTUATION and following not in _JS_PUNCTUATION and previous != '\n':
+                    out.append(' ')
+            i = end
+        elif char in '"\'`' or (char == '/' and _starts_regex(out)):
+            end = _skip_quoted(source, i, char)
+            out.append(source[i:end])
+            previous = source[end - 1]
+            i = end
+        else:
+            if out and out[-1] == ' ' and char in _JS_PUNCTUATION:
+                out.pop()
+            out.append(char)
+            previous = char
+            i += 1
+    return ''.join(out).strip() + '\n'
+
+def _starts_regex(out):
+    code = ''.join(out[-20:]).rstrip()
+    if not code or code[-1] in _REGEX_PRECEDERS:
+        return True
+    word = re.search(r'[\w$]+$', code)
+    return bool(word) and word.group() in _REGEX_KEYWORDS
+
+def _read(path):
+    with open(os.path.join(SOURCE_DIR, path), encoding='utf-8') as f:
+        return f.read()
+
+def bundle(name):
+    """The fingerprinted file name and contents of a bundle"""
+    if name not in _built:
+        stem, ext = os.path.splitext(name)
+        if ext == '.css':
+            data = '\n'.join(minify_css(_read(path)) for path in BUNDLES[name]) + '\n'
+        else:
+            # Sources are minified on their own; .min.js files already are
+            parts = [_read(path) if path.endswith('.min.js') else minify_js(_read(path)) for path in BUNDLES[name]]
+            # The separator keeps a source without a trailing semicolon from running into the next one
+            data = ';\n'.join(part.strip() for part in parts) + '\n'
+        digest = hashlib.sha256(data.encode('utf-8')).hexdigest()[:12]
+        _built[name] = (f'{stem}-{digest}{ext}', data)
+    return _built[name]
+
+def url(name, prefix=''):
+    """Address of a bundle from a page, prefix being the path back to the site root"""
+    return f'{prefix}{ASSETS_DIR}/{bundle(name)[0]}'
+
+def sources():
+    """Every file a bundle is built from, relative to the repository root"""
+    return sorted({path for paths in BUNDLES.values() for path in paths})
+
+def reset():
+    """Forget the built bundles, so edited sources are picked up"""
+    _built.clear()
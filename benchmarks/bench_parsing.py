@@ -0,0 +1,80 @@
+"""Benchmark the parsing module against the original parse_number/parse_date
+
+Run from the repository root: python benchmarks/bench_parsing.py
+"""
+import csv
+from datetime import datetime
+import glob
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parsing
+
+def legacy_parse_number(value):
+    """parse_number as it was before the parsing module"""
+    if not value or value.strip() == '':
+        return None
+    try:
+        return float(value.replace(",", "."))
+    except:
+        return None
+
+def legacy_parse_date(value):
+    """parse_date as it was before the parsing module"""
+    try:
+        return datetime.strptime(value.strip(), "%d/%m/%Y").date()
+    except:
+        return None
+
+def csv_cells():
+    """Split every cell of the site's CSVs into date-like and other cells"""
+    dates, others = [], []
+    for csv_file in sorted(glob.glob('csv/*.csv')):
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            for row in list(csv.reader(f))[1:]:
+                for cell in row:
+                    (dates if cell.count('/') == 2 and len(cell) <= 10 else others).append(cell)
+    return dates, others
+
+def synthetic_cells(count, seed=0):
+    """Cells shaped like the CSVs: scores with decimal commas, blanks and repeated dates"""
+    rng = random.Random(seed)
+    numbers = [rng.choice(['', f'{rng.randint(50, 99)},{rng.randint(0, 9)}', str(rng.randint(0, 600)), 'n/a']) for _ in range(count)]
+    dates = [f'{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2009, 2025)}' for _ in range(count)]
+    return dates, numbers
+
+def best_of(function, cells, repeat=5, clear=None):
+    """Best wall time of parsing all cells, optionally clearing a cache before each run"""
+    timings = []
+    for _ in range(repeat):
+        if clear:
+            clear()
+        start = time.perf_counter()
+        for cell in cells:
+            function(cell)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def clear_caches():
+    parsing.parse_number_result.cache_clear()
+    parsing.parse_date_result.cache_clear()
+
+def main():
+    suites = [('csv files', csv_cells()), ('synthetic 200k', synthetic_cells(200000))]
+    print(f"{'cells':<16}{'parser':<8}{'legacy':>10}{'cold':>10}{'warm':>10}{'speedup':>9}")
+    for label, (dates, numbers) in suites:
+        for name, legacy, current, cells in [
+            ('date', legacy_parse_date, parsing.parse_date, dates),
+            ('number', legacy_parse_number, parsing.parse_number, numbers),
+        ]:
+            legacy_time = best_of(legacy, cells)
+            cold_time = best_of(current, cells, clear=clear_caches)
+            warm_time = best_of(current, cells)
+            print(f"{label:<16}{name:<8}{legacy_time * 1000:>8.1f}ms{cold_time * 1000:>8.1f}ms{warm_time * 1000:>8.1f}ms{legacy_time / cold_time:>8.1f}x")
+
+if __name__ == '__main__':
+    main()
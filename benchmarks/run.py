@@ -0,0 +1,194 @@
+"""Benchmark each stage of generate.py on synthetic leaderboards of growing size
+
+Usage (from the repository root):
+    python benchmarks/run.py                       # 1k and 100k rows, compared to the baseline
+    python benchmarks/run.py --sizes 1000,100000,1000000
+    python benchmarks/run.py --update-baseline     # record this machine's numbers as the baseline
+
+Each size is timed stage by stage (CSV load, column parsing, analyze_leaderboard,
+get_*_records, rendering and file writes), then replayed under tracemalloc to record
+the peak memory of every stage. The run fails when a stage is slower, or uses more
+memory, than the stored baseline allows. Baselines are machine specific: refresh
+them with --update-baseline when moving to different hardware.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import generate
+import synthetic
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Differences below these are treated as noise, whatever the tolerance
+MIN_SLACK_SECONDS = 0.05
+MIN_SLACK_MB = 1.0
+
+def _csv_files():
+    return [generate.EVENTS_CSV] + [config['csv_file'] for config in generate.COURSES_CONFIG.values()]
+
+def _pages():
+    pages = []
+    for job in generate.page_jobs():
+        name, html_style, config = job
+        csv_file = generate.EVENTS_CSV if html_style == "simple" else config['csv_file']
+        pages.append((name, html_style, config, csv_file))
+    return pages
+
+def pipeline_stages(engine):
+    """The build split into named stages sharing one state dict, in execution order"""
+    state = {}
+
+    def load():
+        state['dataset'] = generate.Dataset()
+        for csv_file in _csv_files():
+            state['dataset'].rows(csv_file)
+
+    def parse():
+        # analyze_leaderboard builds its records from these columns, shared by every page of a CSV
+        dataset = state['dataset']
+        for name, html_style, config, csv_file in _pages():
+            dataset.column(csv_file, config['score_col'], generate.parse_number)
+            dataset.column(csv_file, config['date_col'], generate.parse_date)
+            for key in ('event1_col', 'event2_col', 'event3_col', 'bonus_col'):
+                if key in config:
+                    dataset.column(csv_file, config[key], generate.parse_number)
+
+    def analyze():
+        state['analysis'] = {}
+        state['proof_tiers'] = {}
+        for name, html_style, config, csv_file in _pages():
+            # Course pages are analyzed per proof tier, as in the real build
+            proof_tiers = state['proof_tiers'][name] = {} if html_style == "advanced" else None
+            state['analysis'][name] = generate.analyze_leaderboard(
+                csv_file, config['score_col'], config['date_col'], config['link_col'], config.get('lower_is_better', False),
+                config.get('event1_col'), config.get('event2_col'), config.get('event3_col'), config.get('bonus_col'),
+                dataset=state['dataset'], engine=engine, proof_tiers=proof_tiers
+            )
+
+    def records():
+        state['course_records'] = generate.get_course_records(state['dataset'])
+        state['event_records'] = generate.get_event_records(state['dataset'])
+
+    def render():
+        state['rendered'] = {}
+        for name, html_style, config, csv_file in _pages():
+            all_records, changes, first_days, top_days, _ = state['analysis'][name]
+            if html_style == "simple":
+                fragments = generate.render_simple_html(name, all_records, changes, first_days, top_days, config.get('lower_is_better', False))
+            else:
+                fragments = generate.render_advanced_html(name, all_records, changes, first_days, top_days,
+                                                          config['event1_name'], config['event2_name'], config['event3_name'],
+                                                          proof_tiers=state['proof_tiers'][name])
+            state['rendered'][config['output_file']] = list(fragments)
+        state['rendered']['index.html'] = list(generate.render_index_html(state['course_records'], state['event_records']))
+
+    def write():
+        for output_file, fragments in state['rendered'].items():
+            generate.write_page(output_file, fragments)
+
+    return [('load', load), ('parse', parse), ('analyze', analyze), ('records', records), ('render', render), ('write', write)]
+
+def measure(directory, engine='python', memory=True):
+    """Time (and optionally trace the peak memory of) every stage on the CSVs under directory"""
+    previous_dir = os.getcwd()
+    os.chdir(directory)
+    try:
+        os.makedirs('courses', exist_ok=True)
+        os.makedirs('events', exist_ok=True)
+        result = {'seconds': {}, 'peak_mb': {}}
+        for name, stage in pipeline_stages(engine):
+            start = time.perf_counter()
+            stage()
+            result['seconds'][name] = round(time.perf_counter() - start, 4)
+        if memory:
+            # A second, traced pass so tracemalloc overhead does not skew the timings
+            tracemalloc.start()
+            try:
+                for name, stage in pipeline_stages(engine):
+                    tracemalloc.reset_peak()
+                    stage()
+                    result['peak_mb'][name] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 2)
+            finally:
+                tracemalloc.stop()
+        return result
+    finally:
+        os.chdir(previous_dir)
+
+def find_regressions(results, baseline, tolerance):
+    """List the stages that got slower or hungrier than the baseline allows"""
+    regressions = []
+    for size, result in results.items():
+        expected = baseline.get(size)
+        if not expected:
+            continue
+        for metric, slack, unit in (('seconds', MIN_SLACK_SECONDS, 's'), ('peak_mb', MIN_SLACK_MB, 'MB')):
+            for stage, value in result.get(metric, {}).items():
+                reference = expected.get(metric, {}).get(stage)
+                if reference is None:
+                    continue
+                if value > reference * (1 + tolerance) and value - reference > slack:
+                    regressions.append(f"{size} rows, {stage}: {value}{unit} vs baseline {reference}{unit}")
+    return regressions
+
+def print_results(results):
+    stages = [name for name, _ in pipeline_stages('python')]
+    print(f"{'rows':>9}  " + ''.join(f"{stage:>16}" for stage in stages))
+    for size, result in results.items():
+        cells = []
+        for stage in stages:
+            seconds = result['seconds'][stage]
+            peak = result['peak_mb'].get(stage)
+            cells.append(f"{seconds:>8.3f}s" + (f"{peak:>6.0f}MB" if peak is not None else ' ' * 8))
+        print(f"{size:>9}  " + ''.join(f"{cell:>16}" for cell in cells))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generate.py on synthetic data")
+    parser.add_argument('--sizes', default='1000,100000', help="comma-separated rows per CSV (default: 1000,100000)")
+    parser.add_argument('--engine', choices=['python', 'numpy'], default='python')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="allowed slowdown ratio before failing (default: 0.5)")
+    args = parser.parse_args()
+
+    results = {}
+    for size in [int(size) for size in args.sizes.split(',')]:
+        directory = tempfile.mkdtemp(prefix='pokeathlon-bench-')
+        try:
+            synthetic.write_dataset(directory, size, args.seed)
+            results[str(size)] = measure(directory, args.engine, memory=not args.no_memory)
+        finally:
+            shutil.rmtree(directory)
+    print_results(results)
+
+    baseline_key = f'engine={args.engine}'
+    try:
+        with open(args.baseline, encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = {}
+
+    if args.update_baseline:
+        stored.setdefault(baseline_key, {}).update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, stored.get(baseline_key, {}), args.tolerance)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Synthetic leaderboard generator writing CSVs in the exact schema of the site's csv/ folder
+
+Usage: python benchmarks/synthetic.py OUTPUT_DIR --rows 100000 [--seed 0]
+"""
+import argparse
+import csv
+from datetime import date, timedelta
+import itertools
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from generate import COURSES_CONFIG, EVENTS_CSV
+
+COURSE_HEADERS = {
+    'Speed Course': ['Player', 'Total Score', 'Hurdle Dash', 'Pennant Capture', 'Relay Run', 'Bonus points', 'Date', 'Link', 'Country', 'Photo', 'Colonna 1'],
+    'Jump Course': ['Player', 'Total Score', 'Lamp Jump', 'Disc Catch', 'Hurdle Dash', 'Bonus points', 'Date', 'Proof', 'Country', 'Photo', 'Colonna 1'],
+    'Power Course': ['Player', 'Total Score', 'Block Smash', 'Circle Push', 'Goal Roll', 'Bonus points', 'Date', 'Link', 'Country', 'Photo', 'Colonna 1'],
+    'Skill Course': ['Player', 'Total Score', 'Snow Throw', 'Goal Roll', 'Pennant Capture', 'Bonus points', 'Date', 'Link', 'Country', 'Photo', 'Colonna 1'],
+    'Stamina Course': ['Player', 'Total Score', 'Ring Drop', 'Relay Run', 'Block Smash', 'Bonus points', 'Date', 'Link', 'Country', 'Photo', 'Colonna 1'],
+}
+
+EVENTS_HEADER = ['Player', 'Hurdle Dash', 'Pennant Capture', 'Circle Push', 'Block Smash', 'Disc Catch', 'Lamp Jump',
+                 'Relay Run', 'Ring Drop', 'Snow Throw', 'Goal Roll', 'Date', 'Link', 'Country', 'Row ID']
+
+# Raw score ranges per event; Hurdle Dash and Relay Run are written with a decimal comma
+EVENT_RANGES = {
+    'Hurdle Dash': (70.0, 95.0), 'Pennant Capture': (30, 66), 'Circle Push': (40, 70), 'Block Smash': (50, 150),
+    'Disc Catch': (50, 110), 'Lamp Jump': (300, 600), 'Relay Run': (10.0, 21.0), 'Ring Drop': (50, 200),
+    'Snow Throw': (30, 130), 'Goal Roll': (5, 20),
+}
+
+COUNTRIES = ['Japan', 'Western countries', 'Italian', 'USA', 'France', 'Germany']
+
+PROOF_SITES = [
+    ('https://www.youtube.com/watch?v={}', 'y'),
+    ('https://youtu.be/{}', 'y'),
+    ('https://i.imgur.com/{}.png', 'y'),
+    ('https://cyberscore.me.uk/records/{}', 'n'),
+    ('https://www.videogamesrecords.net/record/{}', 'n'),
+    ('https://forums.serebii.net/threads/{}/', 'n'),
+]
+
+FIRST_DATE = date(2009, 9, 12)
+HISTORY_DAYS = 16 * 365
+
+class _Submissions:
+    """Shared source of players, dates and proof links with realistic repetition"""
+
+    def __init__(self, rows, rng):
+        self.rng = rng
+        self.rows = rows
+        # A Zipf-like pool: a few regulars submit most of the runs
+        pool_size = max(10, rows // 20)
+        self.players = [f'player{i:06d}' for i in range(pool_size)]
+        self.countries = [rng.choice(COUNTRIES) for _ in range(pool_size)]
+        self.cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(pool_size)))
+
+    def __iter__(self):
+        rng = self.rng
+        day = 0.0
+        step = 2 * HISTORY_DAYS / self.rows
+        for row_num in range(2, self.rows + 2):
+            day += rng.random() * step
+            player = rng.choices(range(len(self.players)), cum_weights=self.cum_weights)[0]
+            site, photo = rng.choice(PROOF_SITES)
+            yield (
+                row_num, self.players[player], self.countries[player],
+                (FIRST_DATE + timedelta(days=int(day))).strftime('%d/%m/%Y'),
+                site.format(rng.randrange(10 ** 8)), photo,
+            )
+
+def _decimal_comma(value):
+    return f'{value:.1f}'.replace('.', ',')
+
+def _raw_score(event_name, rng):
+    low, high = EVENT_RANGES[event_name]
+    if isinstance(low, float):
+        return _decimal_comma(rng.uniform(low, high))
+    return str(rng.randint(low, high))
+
+def write_course_csv(path, header, rows, seed=0):
+    """Write a course CSV: total = three event points + bonus, with some rows missing the breakdown"""
+    rng = random.Random(seed)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for row_num, player, country, day, link, photo in _Submissions(rows, rng):
+            events = [rng.randint(60, 200) for _ in range(3)]
+            bonus = rng.randint(40, 100)
+            total = sum(events) + bonus
+            if rng.random() < 0.1:
+                # Claimed totals often come without the per-event breakdown
+                events, bonus = ['', '', ''], ''
+            writer.writerow([player, total, *events, bonus, day, link, country, photo, row_num])
+
+def write_events_csv(path, rows, seed=0):
+    """Write the events CSV: one submission per row with some events left blank"""
+    rng = random.Random(seed)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(EVENTS_HEADER)
+        events = EVENTS_HEADER[1:11]
+        for row_num, player, country, day, link, _ in _Submissions(rows, rng):
+            scores = [_raw_score(event_name, rng) if rng.random() < 0.7 else '' for event_name in events]
+            writer.writerow([player, *scores, day, link, country, row_num])
+
+def write_dataset(directory, rows, seed=0):
+    """Write all six CSVs under directory, at the same relative paths generate.py reads"""
+    os.makedirs(os.path.join(directory, os.path.dirname(EVENTS_CSV)), exist_ok=True)
+    write_events_csv(os.path.join(directory, EVENTS_CSV), rows, seed)
+    for offset, (course_name, config) in enumerate(COURSES_CONFIG.items(), 1):
+        write_course_csv(os.path.join(directory, config['csv_file']), COURSE_HEADERS[course_name], rows, seed + offset)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Write synthetic leaderboard CSVs")
+    parser.add_argument('directory')
+    parser.add_argument('--rows', type=int, default=1000, help="rows per CSV file")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    write_dataset(args.directory, args.rows, args.seed)
@@ -0,0 +1,95 @@
+"""NumPy engine for the leaderboard replay, working on whole score/date/player columns at once"""
+import numpy as np
+
+# Rows are compared against each other in blocks of this size, so a block costs at most BLOCK_SIZE² comparisons
+BLOCK_SIZE = 1024
+
+class RecordColumns:
+    """Scores, day numbers and interned player codes of a leaderboard, stored as arrays"""
+
+    def __init__(self, scores, days, player_codes, player_names):
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.days = np.asarray(days, dtype=np.int64)
+        self.player_codes = np.asarray(player_codes, dtype=np.int64)
+        self.player_names = list(player_names)
+
+    @classmethod
+    def from_records(cls, records):
+        """Build the columns from parsed submissions (records with total_score, date and player)"""
+        codes = {}
+        player_codes = [codes.setdefault(r.player, len(codes)) for r in records]
+        scores = np.fromiter((r.total_score for r in records), dtype=np.float64, count=len(records))
+        days = np.fromiter((r.date.toordinal() for r in records), dtype=np.int64, count=len(records))
+        return cls(scores, days, player_codes, codes)
+
+    def __len__(self):
+        return len(self.scores)
+
+def _higher_is_better(scores, lower_is_better):
+    scores = np.asarray(scores, dtype=np.float64)
+    return -scores if lower_is_better else scores
+
+def wr_progression(scores, lower_is_better=False):
+    """Indices of the rows that set a new world record, from a running maximum (or minimum)"""
+    values = _higher_is_better(scores, lower_is_better)
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64)
+    previous_best = np.concatenate(([-np.inf], np.maximum.accumulate(values)[:-1]))
+    # Ties do not take the record: the earlier submission keeps it
+    return np.flatnonzero(values > previous_best)
+
+def board_change_rows(scores, k=3, lower_is_better=False):
+    """Indices of the rows that enter the top K when submissions are replayed in order
+
+    A row enters the board when fewer than K earlier rows are at least as good.
+    Each block only compares its rows to the K best values seen so far, plus
+    the rows of the block that could still enter the board.
+    """
+    values = _higher_is_better(scores, lower_is_better)
+    if k == 1:
+        return wr_progression(scores, lower_is_better)
+    best = np.empty(0, dtype=np.float64)  # ascending, at most k values
+    changes = []
+    for start in range(0, len(values), BLOCK_SIZE):
+        block = values[start:start + BLOCK_SIZE]
+        earlier_better = len(best) - np.searchsorted(best, block, side='left')
+        candidates = np.flatnonzero(earlier_better < k)
+        if len(candidates):
+            candidate_values = block[candidates]
+            # Rows outside the candidates are below the current K-th best, so they never outrank a candidate
+            pairwise = candidate_values[None, :] >= candidate_values[:, None]
+            within_block = np.tril(pairwise, -1).sum(axis=1)
+            entering = candidates[earlier_better[candidates] + within_block < k]
+            changes.append(entering + start)
+            best = np.sort(np.concatenate((best, candidate_values)))[-k:]
+    if not changes:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(changes)
+
+def first_place_days(columns, final_day=None, lower_is_better=False):
+    """Total days each player held #1, from the tenure boundaries of the WR progression
+
+    Players are returned in the order of their first tenure, like the
+    sequential replay.
+    """
+    if len(columns) == 0:
+        return {}
+    if final_day is None:
+        final_day = columns.days[-1]
+    records = wr_progression(columns.scores, lower_is_better)
+    holders = columns.player_codes[records]
+    # A tenure starts whenever the record passes to a different player
+    starts = records[np.concatenate(([True], holders[1:] != holders[:-1]))]
+    start_days = columns.days[starts]
+    end_days = np.concatenate((start_days[1:], [final_day]))
+    durations = np.maximum(end_days - start_days, 0)
+    holder_codes = columns.player_codes[starts]
+
+    totals = np.bincount(holder_codes, weights=durations, minlength=len(columns.player_names))
+    _, first_seen = np.unique(holder_codes, return_index=True)
+    first_holder_days = {}
+    for code in holder_codes[np.sort(first_seen)]:
+        name = columns.player_names[code]
+        if name:
+            first_holder_days[name] = int(totals[code])
+    return first_holder_days
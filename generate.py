@@ -1,22 +1,36 @@
+import argparse
+import bisect
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 import csv
-from datetime import datetime
+from datetime import date, datetime
+import glob
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
+import json
+import math
 import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from urllib.parse import quote
 
-def parse_number(value):
-    """Parse a number from string, handling commas and empty values"""
-    if not value or value.strip() == '':
-        return None
-    try:
-        return float(value.replace(",", "."))
-    except:
-        return None
+import assets
+from parsing import parse_date, parse_date_result, parse_number, parse_number_result
+import pid_solver
+import scoring
+import store
 
-def parse_date(value):
-    """Parse a date from DD/MM/YYYY format"""
-    try:
-        return datetime.strptime(value.strip(), "%d/%m/%Y").date()
-    except:
-        return None
+try:
+    import columnar
+except ImportError:
+    # NumPy is optional: without it only the pure Python engine is available
+    columnar = None
 
 def get_proof_type(photo_val, link):
     """Determine proof type based on photo column and link"""
@@ -24,6 +38,21 @@ def get_proof_type(photo_val, link):
         return 'video' if ('youtube.com' in link or 'youtu.be' in link) else 'photo'
     return 'claimed'
 
+# Proof filters of the course pages (the radio values in js/sorting-logic.js) and the proof types they accept
+ALL_TIER = 'all-record'
+PROOF_TIERS = {
+    ALL_TIER: None,
+    'verified-record': ('photo', 'video', 'livestream'),
+    'photo': ('photo',),
+    'video': ('video',),
+    'livestream': ('livestream',)
+}
+
+# What a page shows for one proof tier: the current record, the record history and the tenure days
+TierAnalysis = namedtuple('TierAnalysis', 'current history first_holder_days top_presence_days')
+# One row of a ranking table; previous is the rank it is compared against, None for a newly ranked player
+RankedBest = namedtuple('RankedBest', 'rank record percentile previous')
+
 def format_proof_link(link, proof_type, is_event=False):
     """Format the proof link with appropriate text"""
     if proof_type == 'video':
@@ -33,123 +62,1015 @@ def format_proof_link(link, proof_type, is_event=False):
     else:
         return f'<a href="{link}">{"Link" if is_event else "Claimed Only"}</a>'
 
-def analyze_leaderboard(file_path, score_col, date_col, link_col, lower_is_better=False, 
-                       event1_col=None, event2_col=None, event3_col=None, bonus_col=None):
-    """Analyze leaderboard changes and return statistics"""
-    top_scores = []
-    top3_changes = []
-    first_place_periods = []
-    top23_periods = {}
-    current_top23_holders = {}
-    current_first_holder = None
-    current_first_start = None
-    all_records = []
-    record_improvements = []
-    
-    with open(file_path, newline='', encoding='utf-8') as f:
+class Record:
+    """One parsed submission; slotted, with player names and links interned"""
+    __slots__ = ('row_num', 'player', 'total_score', 'event1', 'event2', 'event3', 'bonus_points', 'date', 'link', 'photo')
+
+    def __init__(self, row_num, player, total_score, event1=None, event2=None, event3=None, bonus_points=None, date=None, link='', photo='n'):
+        self.row_num = row_num
+        self.player = sys.intern(player)
+        self.total_score = total_score
+        self.event1 = event1
+        self.event2 = event2
+        self.event3 = event3
+        self.bonus_points = bonus_points
+        self.date = date
+        self.link = sys.intern(link)
+        self.photo = sys.intern(photo)
+
+class Dataset:
+    """In-memory view of the leaderboard CSVs, each file read and each column parsed only once
+
+    With cache=False nothing is kept: stream() reads the file again on every
+    call, so memory does not grow with the size of the CSVs. With checkpoints
+    (a Checkpoints), page analyses resume from the state saved by the last build.
+    """
+
+    def __init__(self, cache=True, checkpoints=None):
+        self.cache = cache
+        self.checkpoints = checkpoints
+        self._headers = {}
+        self._rows = {}
+        self._columns = {}
+
+    def _load(self, csv_file):
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        if self.cache:
+            self._headers[csv_file] = rows[0] if rows else []
+            self._rows[csv_file] = rows[1:]
+        return rows[0] if rows else [], rows[1:]
+
+    def header(self, csv_file):
+        """Return the header row of a CSV file"""
+        if csv_file not in self._headers:
+            return self._load(csv_file)[0]
+        return self._headers[csv_file]
+
+    def rows(self, csv_file):
+        """Return the data rows of a CSV file (header excluded)"""
+        if csv_file not in self._rows:
+            return self._load(csv_file)[1]
+        return self._rows[csv_file]
+
+    def stream(self, csv_file):
+        """Yield (row_num, row) for the data rows of a CSV file, from memory if cached"""
+        if self.cache:
+            return enumerate(self.rows(csv_file), 2)
+        return read_rows(csv_file)
+
+    def column(self, csv_file, col, parser):
+        """Return a 1-based column parsed with parser, None where the row is too short"""
+        key = (csv_file, col, parser)
+        values = self._columns.get(key)
+        if values is None:
+            values = [parser(row[col - 1]) if len(row) >= col else None for row in self.rows(csv_file)]
+            if self.cache:
+                self._columns[key] = values
+        return values
+
+    def parse_records(self, csv_file, score_col, date_col, link_col, event1_col=None, event2_col=None, event3_col=None, bonus_col=None):
+        """Yield (row, Record) as parse_records() does, from the parsed columns shared by every page of a CSV"""
+        rows = self.rows(csv_file)
+        numbers = [self.column(csv_file, col, parse_number) if col else itertools.repeat(None)
+                   for col in (score_col, event1_col, event2_col, event3_col, bonus_col)]
+        dates = self.column(csv_file, date_col, parse_date)
+        for row_num, row, score, event1, event2, event3, bonus, day in zip(itertools.count(2), rows, *numbers, dates):
+            size = len(row)
+            yield row, Record(
+                row_num, row[0].strip() if row else '', score, event1, event2, event3, bonus, day,
+                row[link_col - 1] if size >= link_col else '',
+                row[9] if size > 9 else 'n'
+            )
+
+    def invalidate(self, csv_file):
+        """Forget a CSV file so that it is read and parsed again on next use"""
+        self._headers.pop(csv_file, None)
+        self._rows.pop(csv_file, None)
+        for key in [key for key in self._columns if key[0] == csv_file]:
+            del self._columns[key]
+
+# Streaming ingestion: read_rows -> parse_records -> validate_records -> consume(consumers).
+# Each stage is a generator, so a CSV is processed in one forward pass whatever its size.
+
+def read_rows(csv_file):
+    """Yield (row_num, row) for the data rows of a CSV file, reading it lazily"""
+    with open(csv_file, newline='', encoding='utf-8') as f:
         reader = csv.reader(f)
-        rows = list(reader)
-        
-        # Parse all records
-        for i, row in enumerate(rows[1:], 1):
-            if len(row) < max(score_col, date_col):
-                continue
-                
-            record = {
-                'row_num': i + 1,
-                'player': row[0].strip(),
-                'total_score': parse_number(row[score_col - 1]),
-                'event1': parse_number(row[event1_col - 1]) if event1_col and len(row) >= event1_col else None,
-                'event2': parse_number(row[event2_col - 1]) if event2_col and len(row) >= event2_col else None,
-                'event3': parse_number(row[event3_col - 1]) if event3_col and len(row) >= event3_col else None,
-                'bonus_points': parse_number(row[bonus_col - 1]) if bonus_col and len(row) >= bonus_col else None,
-                'date': parse_date(row[date_col - 1]),
-                'link': row[link_col - 1] if len(row) >= link_col else '',
-                'photo': row[9] if len(row) > 9 else 'n'
-            }
-            
-            if record['total_score'] is None or record['date'] is None:
-                continue
-            all_records.append(record)
-        
-        # Analyze leaderboard changes
-        for record in all_records:
-            previous_top3 = top_scores.copy()
-            previous_first = top_scores[0] if top_scores else None
-            
-            # Update leaderboard
-            top_scores.append((record['row_num'], record['player'], record['total_score'], record))
-            top_scores.sort(key=lambda x: (x[2] if lower_is_better else -x[2], x[0]))
-            top_scores = top_scores[:3]
-            
-            # Check if leaderboard changed
-            if top_scores != previous_top3:
-                new_top23_names = set(entry[1] for entry in top_scores[1:])
-                
-                # End periods for players no longer in positions 2-3
-                for player, start_date in current_top23_holders.items():
-                    if player not in new_top23_names:
-                        if player not in top23_periods:
-                            top23_periods[player] = []
-                        top23_periods[player].append((start_date, record['date']))
-                
-                # Handle first place changes
-                new_first = top_scores[0]
-                if previous_first and new_first[1] != previous_first[1]:
-                    if current_first_holder and current_first_start:
-                        first_place_periods.append((current_first_holder, current_first_start, record['date']))
-                    current_first_holder = new_first[1]
-                    current_first_start = record['date']
-                elif not previous_first:
-                    current_first_holder = new_first[1]
-                    current_first_start = record['date']
-                
-                # Start new periods for players entering positions 2-3
-                new_top23_holders = {}
-                for entry in top_scores[1:]:
-                    player = entry[1]
-                    new_top23_holders[player] = current_top23_holders.get(player, record['date'])
-                
-                current_top23_holders = new_top23_holders
-                record_improvements.append(record['row_num'])
-                top3_changes.append((record['row_num'], [(n, s, r) for _, n, s, r in top_scores], record['date']))
-    
-    # End final periods
-    if all_records:
-        final_date = all_records[-1]['date']
-        for player, start_date in current_top23_holders.items():
-            if player not in top23_periods:
-                top23_periods[player] = []
-            top23_periods[player].append((start_date, final_date))
-        
-        if current_first_holder and current_first_start:
-            first_place_periods.append((current_first_holder, current_first_start, final_date))
-    
-    # Calculate total days
-    first_holder_days = {}
-    top23_presence_days = {}
-    
-    for player, start_date, end_date in first_place_periods:
-        days = max(0, (end_date - start_date).days)
-        first_holder_days[player] = first_holder_days.get(player, 0) + days
-    
-    for player, periods in top23_periods.items():
-        total_days = sum(max(0, (end_date - start_date).days) for start_date, end_date in periods)
-        top23_presence_days[player] = total_days
+        next(reader, None)
+        yield from enumerate(reader, 2)
+
+def parse_records(rows, score_col, date_col, link_col, event1_col=None, event2_col=None, event3_col=None, bonus_col=None):
+    """Yield (row, Record) for every row; cells that are missing or do not parse give None"""
+    # Columns left out are never reached, so they parse as missing
+    event1_col, event2_col, event3_col, bonus_col = [col or sys.maxsize for col in (event1_col, event2_col, event3_col, bonus_col)]
+    for row_num, row in rows:
+        size = len(row)
+        yield row, Record(
+            row_num, row[0].strip() if row else '',
+            parse_number(row[score_col - 1]) if size >= score_col else None,
+            parse_number(row[event1_col - 1]) if size >= event1_col else None,
+            parse_number(row[event2_col - 1]) if size >= event2_col else None,
+            parse_number(row[event3_col - 1]) if size >= event3_col else None,
+            parse_number(row[bonus_col - 1]) if size >= bonus_col else None,
+            parse_date(row[date_col - 1]) if size >= date_col else None,
+            row[link_col - 1] if size >= link_col else '',
+            row[9] if size > 9 else 'n'
+        )
+
+def cell_errors(row_num, row, number_cols, date_col):
+    """The ParseErrors of the cells of a row that hold something other than a number or date, as report entries"""
+    results = [(col, parse_number_result(row[col - 1])) for col in number_cols if col and len(row) >= col]
+    if len(row) >= date_col:
+        results.append((date_col, parse_date_result(row[date_col - 1])))
+    # Empty cells are expected: event rows only fill the events that were played
+    return [{'row': row_num, 'column': col, 'text': result.error.text, 'reason': result.error.reason}
+            for col, result in results if result.error and result.error.reason != 'empty']
+
+def validate_records(parsed, score_col, date_col, counts, errors=None, number_cols=()):
+    """Yield the records with both a score and a date, counting rows read, skipped and kept in counts
+
+    If errors is a list, the cells of the score, date and number_cols columns that
+    did not parse are appended to it (see cell_errors).
+    """
+    for row, record in parsed:
+        counts['rows_read'] += 1
+        if len(row) < max(score_col, date_col):
+            counts['rows_skipped_short'] += 1
+            continue
+        if errors is not None:
+            errors.extend(cell_errors(record.row_num, row, (score_col, *number_cols), date_col))
+        if record.total_score is None or record.date is None:
+            counts['rows_skipped_missing'] += 1
+        else:
+            counts['records'] += 1
+            yield record
+
+def _timed(stream, spent):
+    """Yield the items of stream, adding the seconds spent producing them to spent[0]"""
+    iterator = iter(stream)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            spent[0] += time.perf_counter() - start
+        yield item
+
+def consume(stream, consumers):
+    """Feed every item of a stream to each consumer (a callable) in a single pass"""
+    for item in stream:
+        for consumer in consumers:
+            consumer(item)
+
+class TopKBoard:
+    """Bounded top-K leaderboard kept sorted, updated with one binary search per submission"""
+
+    def __init__(self, k=3, lower_is_better=False):
+        self.k = k
+        self.lower_is_better = lower_is_better
+        self._keys = []
+        self.entries = []
+
+    def push(self, row_num, player, score, record):
+        """Offer a submission to the board, returning True if the board changed"""
+        # Ties keep the earlier submission ahead, as rows arrive in file order
+        key = (score if self.lower_is_better else -score, row_num)
+        if len(self._keys) >= self.k and key >= self._keys[-1]:
+            return False
+        position = bisect.bisect(self._keys, key)
+        self._keys.insert(position, key)
+        self.entries.insert(position, (row_num, player, score, record))
+        if len(self._keys) > self.k:
+            self._keys.pop()
+            self.entries.pop()
+        return True
+
+class PersonalBests:
+    """Each player's best submission on a leaderboard, kept in a dict as submissions arrive and sorted once to rank them"""
+
+    def __init__(self, lower_is_better=False):
+        self.lower_is_better = lower_is_better
+        self.best = {}
+        self._keys = {}
+
+    def push(self, record):
+        """Offer a submission, keeping it if it beats the player's best so far"""
+        key = record.total_score if self.lower_is_better else -record.total_score
+        # Ties keep the earlier submission, as on the board
+        if key < self._keys.get(record.player, math.inf) and record.player:
+            self._keys[record.player] = key
+            self.best[record.player] = record
+
+    def ranked(self):
+        """(rank, record) for every player's best, best first; equal scores share a rank and keep file order"""
+        sign = 1 if self.lower_is_better else -1
+        ranked = []
+        for position, record in enumerate(sorted(self.best.values(), key=lambda r: (sign * r.total_score, r.row_num)), 1):
+            tied = ranked and ranked[-1][1].total_score == record.total_score
+            ranked.append((ranked[-1][0] if tied else position, record))
+        return ranked
+
+class LeaderboardAnalyzer:
+    """Replay submissions through a top-K board and track #1 and top-K tenures and personal bests"""
+
+    def __init__(self, lower_is_better=False, top_k=3):
+        self.board = TopKBoard(top_k, lower_is_better)
+        self.bests = PersonalBests(lower_is_better)
+        self.board_changes = []
+        self.history = []
+        self.record_improvements = []
+        self.first_place_periods = []
+        self.top_periods = {}
+        self.current_top_holders = {}
+        self.current_first_holder = None
+        self.current_first_start = None
+        self.last_date = None
+
+    def push(self, record):
+        """Feed the next submission in file order, returning True if the top K changed"""
+        self.last_date = record.date
+        self.bests.push(record)
+        previous_first = self.board.entries[0] if self.board.entries else None
+        if not self.board.push(record.row_num, record.player, record.total_score, record):
+            return False
+
+        top_scores = self.board.entries
+        new_top_names = set(entry[1] for entry in top_scores[1:])
+
+        # End periods for players no longer in positions 2-K
+        for player, start_date in self.current_top_holders.items():
+            if player not in new_top_names:
+                self.top_periods.setdefault(player, []).append((start_date, record.date))
+
+        # Handle first place changes
+        new_first = top_scores[0]
+        if previous_first and new_first[1] != previous_first[1]:
+            if self.current_first_holder and self.current_first_start:
+                self.first_place_periods.append((self.current_first_holder, self.current_first_start, record.date))
+            self.current_first_holder = new_first[1]
+            self.current_first_start = record.date
+        elif not previous_first:
+            self.current_first_holder = new_first[1]
+            self.current_first_start = record.date
+
+        # Start new periods for players entering positions 2-K
+        self.current_top_holders = {
+            entry[1]: self.current_top_holders.get(entry[1], record.date) for entry in top_scores[1:]
+        }
+        self.record_improvements.append(record.row_num)
+        self.history.append(record)
+        self.board_changes.append((record.row_num, [(n, s, r) for _, n, s, r in top_scores], record.date))
+        return True
+
+    def finish(self, final_date=None):
+        """Close the open tenures and return (board_changes, first_holder_days, top_presence_days)"""
+        first_place_periods = list(self.first_place_periods)
+        top_periods = {player: list(periods) for player, periods in self.top_periods.items()}
+        final_date = final_date or self.last_date
+
+        # End final periods
+        if final_date:
+            for player, start_date in self.current_top_holders.items():
+                top_periods.setdefault(player, []).append((start_date, final_date))
+            if self.current_first_holder and self.current_first_start:
+                first_place_periods.append((self.current_first_holder, self.current_first_start, final_date))
+
+        # Calculate total days
+        first_holder_days = {}
+        for player, start_date, end_date in first_place_periods:
+            days = max(0, (end_date - start_date).days)
+            first_holder_days[player] = first_holder_days.get(player, 0) + days
+
+        top_presence_days = {}
+        for player, periods in top_periods.items():
+            top_presence_days[player] = sum(max(0, (end_date - start_date).days) for start_date, end_date in periods)
+
+        return self.board_changes, first_holder_days, top_presence_days
+
+    def state(self):
+        """What from_state() needs to rebuild the analyzer: the submissions that changed the board, the personal bests and the last date"""
+        return {
+            'history': [record.row_num for record in self.history],
+            'bests': [record.row_num for record in self.bests.best.values()],
+            'last_date': self.last_date.toordinal() if self.last_date else None
+        }
+
+    @classmethod
+    def from_state(cls, state, records, lower_is_better=False, top_k=3):
+        """Rebuild an analyzer from state(), records mapping row numbers to submissions"""
+        analyzer = cls(lower_is_better, top_k)
+        # Submissions that left the board as it was changed nothing else either, so replaying the others is exact
+        for row_num in state['history']:
+            analyzer.push(records[row_num])
+        # Bests that never changed the board were not replayed, so they are restored as saved
+        analyzer.bests = PersonalBests(lower_is_better)
+        for row_num in state['bests']:
+            analyzer.bests.push(records[row_num])
+        analyzer.last_date = date.fromordinal(state['last_date']) if state['last_date'] else None
+        return analyzer
+
+def _push_proof_tiers(tier_analyzers, record):
+    proof_type = get_proof_type(record.photo, record.link)
+    for _, proof_types, tier_analyzer in tier_analyzers:
+        if proof_type in proof_types:
+            tier_analyzer.push(record)
+
+CHECKPOINT_DIR = '.build-cache'
+
+def _hash_file(f, digest, size=None):
+    """Feed f to digest from its current position, at most size bytes, returning how many were read"""
+    read = 0
+    while size is None or read < size:
+        chunk = f.read(1 << 20 if size is None else min(1 << 20, size - read))
+        if not chunk:
+            break
+        digest.update(chunk)
+        read += len(chunk)
+    return read
+
+def _record_values(record):
+    return [record.row_num, record.player, record.total_score, record.event1, record.event2, record.event3,
+            record.bonus_points, record.date.toordinal(), record.link, record.photo]
+
+def _record_from_values(values):
+    values[7] = date.fromordinal(values[7])
+    return Record(*values)
+
+class Checkpoints:
+    """Analyzer states saved by each build, so the next one only replays the rows appended to a CSV since
+
+    A checkpoint holds the number of bytes of the CSV it covers and their SHA-256.
+    It is resumed from only while the file still starts with those bytes and the
+    generator is unchanged; an edit to earlier rows means a full replay, after
+    which the checkpoint is rewritten.
+    """
+
+    def __init__(self, directory=CHECKPOINT_DIR):
+        self.directory = directory
+        self._version = None
+
+    def version(self):
+        if self._version is None:
+            self._version = generator_version()
+        return self._version
+
+    def path(self, csv_file, params):
+        """One file per CSV and analysis parameters"""
+        key = hashlib.sha256(json.dumps([csv_file, params]).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f'{key}.json')
+
+    def _read(self, csv_file, params):
+        try:
+            with open(self.path(csv_file, params), encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get('generator') != self.version() or checkpoint.get('params') != params:
+            return None
+        return checkpoint
+
+    def load(self, csv_file, params):
+        """Return (checkpoint, rows, source) for a CSV
+
+        source is the (size, digest, ends with a line break) of the file as read now.
+        When a checkpoint covers the start of it, rows yields (row_num, row) for the
+        rows after that; otherwise checkpoint and rows are None.
+        """
+        checkpoint = self._read(csv_file, params)
+        digest = hashlib.sha256()
+        with open(csv_file, 'rb') as f:
+            if checkpoint is not None:
+                covered = _hash_file(f, digest, checkpoint['size'])
+                if covered == checkpoint['size'] and digest.hexdigest() == checkpoint['digest']:
+                    tail = f.read()
+                    digest.update(tail)
+                    source = (covered + len(tail), digest.hexdigest(), tail.endswith(b'\n') if tail else checkpoint['newline'])
+                    if not checkpoint['newline']:
+                        # The last row covered had no line break yet: appended rows start with one
+                        if tail.startswith(b'\r\n'):
+                            tail = tail[2:]
+                        elif tail.startswith(b'\n'):
+                            tail = tail[1:]
+                        elif tail:
+                            # The last row itself was edited
+                            return None, None, source
+                    rows = csv.reader(io.StringIO(tail.decode('utf-8'), newline=''))
+                    return checkpoint, enumerate(rows, checkpoint['counts']['rows_read'] + 2), source
+                # Earlier rows were edited or removed
+                checkpoint = None
+                f.seek(0)
+                digest = hashlib.sha256()
+            size = _hash_file(f, digest)
+            if size:
+                f.seek(-1, os.SEEK_END)
+            source = (size, digest.hexdigest(), f.read(1) == b'\n')
+        return None, None, source
+
+    def save(self, csv_file, params, source, counts, analyzers, parse_errors=None):
+        """Write the state of analyzers (name -> LeaderboardAnalyzer) after replaying the CSV described by source"""
+        size, digest, newline = source
+        records = {record.row_num: record for analyzer in analyzers.values() for record in [*analyzer.history, *analyzer.bests.best.values()]}
+        checkpoint = {
+            'generator': self.version(),
+            'params': params,
+            'size': size,
+            'digest': digest,
+            'newline': newline,
+            'counts': counts,
+            'parse_errors': parse_errors or [],
+            'records': [_record_values(record) for record in records.values()],
+            'analyzers': {name: analyzer.state() for name, analyzer in analyzers.items()}
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        _replace_file(self.path(csv_file, params), json.dumps(checkpoint).encode('utf-8'))
+
+def analyze_leaderboard(file_path, score_col, date_col, link_col, lower_is_better=False, 
+                       event1_col=None, event2_col=None, event3_col=None, bonus_col=None, dataset=None, top_k=3, engine='python', stats=None, proof_tiers=None,
+                       keep_records=True, personal_bests=None, record_consumers=None):
+    """Analyze leaderboard changes and return statistics
+
+    The CSV is streamed through the parser and validator into the top-K replay
+    (and the proof tier replays) in a single pass; with a caching dataset the
+    parsed columns are shared by every page of the CSV. If proof_tiers is a dict, it is
+    filled with a TierAnalysis per proof tier, with one top-K board per tier.
+    With keep_records=False the submissions are not collected: the records
+    returned are only those that changed the top K, which is all a page shows.
+    Such analyses resume from the dataset's checkpoints when it has some, only
+    replaying the rows appended since. If personal_bests is a dict, it is filled
+    with the PersonalBests of the unfiltered board and of every proof tier analyzed.
+    record_consumers are callables fed every valid submission in file order; as
+    they must see every row, such analyses never resume from a checkpoint.
+    The numpy engine works on whole columns, so it always collects them.
+    With stats, the cells that did not parse are listed in stats['parse_errors'].
+    """
+    if dataset is None:
+        dataset = Dataset()
+    counts = {'rows_read': 0, 'rows_skipped_short': 0, 'rows_skipped_missing': 0, 'records': 0}
+    parse_errors = [] if stats is not None else None
+    start = time.perf_counter()
+
+    checkpoints = dataset.checkpoints if engine == 'python' and not keep_records and not record_consumers else None
+    checkpoint = rows = None
+    if checkpoints is not None:
+        params = [score_col, date_col, link_col, lower_is_better, event1_col, event2_col, event3_col, bonus_col, top_k, proof_tiers is not None,
+                  stats is not None]
+        checkpoint, rows, source = checkpoints.load(file_path, params)
+    if checkpoint is None:
+        rows = dataset.stream(file_path)
+        analyzers = {name: LeaderboardAnalyzer(lower_is_better, top_k) for name in PROOF_TIERS
+                     if name == ALL_TIER or proof_tiers is not None}
+    else:
+        counts = checkpoint['counts']
+        if stats is not None:
+            parse_errors = checkpoint['parse_errors']
+        saved = {values[0]: _record_from_values(values) for values in checkpoint['records']}
+        analyzers = {name: LeaderboardAnalyzer.from_state(state, saved, lower_is_better, top_k)
+                     for name, state in checkpoint['analyzers'].items()}
+    rows_before = counts['rows_read']
+
+    columns = (score_col, date_col, link_col, event1_col, event2_col, event3_col, bonus_col)
+    if checkpoint is None and dataset.cache:
+        # Every page of a CSV shares its parsed columns
+        parsed = dataset.parse_records(file_path, *columns)
+    else:
+        parsed = parse_records(rows, *columns)
+    records = validate_records(parsed, score_col, date_col, counts, parse_errors, (event1_col, event2_col, event3_col, bonus_col))
+    # Parsing is interleaved with the replay, so the time spent pulling records is counted apart
+    parse_seconds = [0.0]
+    if stats is not None:
+        records = _timed(records, parse_seconds)
+    analyzer = analyzers[ALL_TIER]
+    tier_analyzers = [(tier, proof_types, analyzers[tier]) for tier, proof_types in PROOF_TIERS.items()
+                      if proof_types is not None and tier in analyzers]
+    consumers = list(record_consumers or [])
+    if tier_analyzers:
+        consumers.append(lambda record: _push_proof_tiers(tier_analyzers, record))
+
+    if engine == 'numpy':
+        # Find the rows that change the board in bulk and only replay those
+        all_records = list(records)
+        # The board only sees the rows that change it, the personal bests need them all
+        consumers.append(analyzer.bests.push)
+        consume(all_records, consumers)
+        final_date = all_records[-1].date if all_records else None
+        columns = columnar.RecordColumns.from_records(all_records)
+        for index in columnar.board_change_rows(columns.scores, top_k, lower_is_better):
+            analyzer.push(all_records[index])
+        top3_changes, _, top23_presence_days = analyzer.finish(final_date)
+        first_holder_days = columnar.first_place_days(columns, lower_is_better=lower_is_better)
+    else:
+        consumers.append(analyzer.push)
+        if keep_records:
+            all_records = []
+            consumers.append(all_records.append)
+        consume(records, consumers)
+        final_date = analyzer.last_date
+        top3_changes, first_holder_days, top23_presence_days = analyzer.finish()
+        if not keep_records:
+            all_records = analyzer.history
+        if checkpoints is not None and (checkpoint is None or counts['rows_read'] > rows_before):
+            checkpoints.save(file_path, params, source, counts, analyzers, parse_errors)
+    record_improvements = analyzer.record_improvements
+    if personal_bests is not None:
+        personal_bests.update((name, tier_analyzer.bests) for name, tier_analyzer in analyzers.items())
+
+    if proof_tiers is not None:
+        proof_tiers[ALL_TIER] = TierAnalysis(
+            analyzer.board.entries[0][3] if analyzer.board.entries else None,
+            analyzer.history, first_holder_days, top23_presence_days
+        )
+        for tier, _, tier_analyzer in tier_analyzers:
+            # Tenures run to the last submission of any tier, as on the unfiltered board
+            changes, first_days, top_days = tier_analyzer.finish(final_date)
+            proof_tiers[tier] = TierAnalysis(
+                tier_analyzer.board.entries[0][3] if tier_analyzer.board.entries else None,
+                tier_analyzer.history, first_days, top_days
+            )
+    add_timing(stats, 'parse', parse_seconds[0])
+    add_timing(stats, 'analyze', time.perf_counter() - start - parse_seconds[0])
+    if stats is not None:
+        stats.update(counts, changes=len(top3_changes), parse_errors=parse_errors)
+        if checkpoints is not None:
+            stats['rows_replayed'] = counts['rows_read'] - rows_before
     
     return all_records, top3_changes, first_holder_days, top23_presence_days, record_improvements
 
-def generate_simple_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, output_file, lower_is_better=False):
-    """Generate simple HTML file for events"""
-    current_record = (min if lower_is_better else max)(all_records, key=lambda x: x['total_score']) if all_records else None
+class Standings:
+    """Top-K boards of a leaderboard indexed by date, so "the top K on date D" is a binary search"""
+
+    def __init__(self, dates, boards):
+        self.dates = dates
+        self.boards = boards
+
+    @classmethod
+    def from_changes(cls, top3_changes):
+        """Build the index from the change log of analyze_leaderboard"""
+        dates = []
+        boards = []
+        for _, board, day in top3_changes:
+            # A backdated row takes effect in file order, from the latest date already seen
+            if dates and day < dates[-1]:
+                day = dates[-1]
+            entries = [(record.row_num, player, score, record.date) for player, score, record in board]
+            if dates and day == dates[-1]:
+                # Only the last board of a day is ever looked up
+                boards[-1] = entries
+            else:
+                dates.append(day)
+                boards.append(entries)
+        return cls(dates, boards)
+
+    def as_of(self, day):
+        """The board at the end of day as (row_num, player, score, date) tuples, empty before the first record"""
+        position = bisect.bisect_right(self.dates, day)
+        return self.boards[position - 1] if position else []
+
+    def year_ends(self):
+        """(year, board) at the end of every year from the first record to the last change"""
+        if not self.dates:
+            return []
+        return [(year, self.as_of(datetime(year, 12, 31).date())) for year in range(self.dates[0].year, self.dates[-1].year + 1)]
+
+def add_timing(stats, stage, seconds):
+    """Accumulate the time spent in a build stage into a stats dict, if one is being collected"""
+    if stats is not None:
+        timings = stats.setdefault('timings', {})
+        timings[stage] = timings.get(stage, 0) + seconds
+
+# Output settings shared by every write_page call; generate_all sets them and copies them to workers
+OUTPUT = {'gzip': False}
+
+def _open_temp(path):
+    """Open a temporary file in the same directory as path for writing, returning (file, temp_path)"""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    return os.fdopen(fd, 'wb'), temp_path
+
+def _commit_temp(temp_path, path):
+    """Rename a finished temporary file over path, keeping the permissions of the file it replaces"""
+    mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+    os.chmod(temp_path, mode)
+    os.replace(temp_path, path)
+
+def _replace_file(path, data):
+    """Write data to path atomically: a temporary file in the same directory renamed over it"""
+    f, temp_path = _open_temp(path)
+    try:
+        with f:
+            f.write(data)
+        _commit_temp(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def _replace_gzip(source_path, gz_file):
+    """Compress source_path into gz_file atomically, a chunk at a time"""
+    f, temp_path = _open_temp(gz_file)
+    try:
+        # mtime=0 keeps the archive identical for identical pages
+        with f, open(source_path, 'rb') as source, gzip.GzipFile(filename='', mode='wb', fileobj=f, mtime=0) as gz:
+            shutil.copyfileobj(source, gz, 1 << 20)
+        _commit_temp(temp_path, gz_file)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def write_page(output_file, fragments, stats=None, compress=True):
+    """Stream page fragments to a temporary file and replace output_file only if its contents changed
+
+    Only one fragment is held in memory at a time: the page is hashed as it is
+    written. With OUTPUT['gzip'] (and compress), a precompressed output_file.gz
+    sibling is kept in sync, compressed from the temporary file.
+    """
+    start = time.perf_counter()
+    render_seconds = [0.0]
+    digest = hashlib.sha256()
+    f, temp_path = _open_temp(output_file)
+    try:
+        with f:
+            for fragment in _timed(fragments, render_seconds):
+                chunk = fragment.encode('utf-8')
+                digest.update(chunk)
+                f.write(chunk)
+        changed = file_digest(output_file) != digest.hexdigest()
+        gz_file = output_file + '.gz'
+        if OUTPUT['gzip'] and compress:
+            if changed or not os.path.exists(gz_file):
+                _replace_gzip(temp_path, gz_file)
+        elif changed and os.path.exists(gz_file):
+            # A stale sibling would keep serving the previous page
+            os.remove(gz_file)
+        if changed:
+            _commit_temp(temp_path, output_file)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    add_timing(stats, 'render', render_seconds[0])
+    add_timing(stats, 'write', time.perf_counter() - start - render_seconds[0])
+    if stats is not None:
+        counter = 'files_written' if changed else 'files_unchanged'
+        stats[counter] = stats.get(counter, 0) + 1
+    return changed
+
+# Row templates are compiled once at import time and reused for every row
+_SIMPLE_CURRENT_ROW = '''
+                <tr>
+                    <td>{score}</td>
+                    <td>{player}</td>
+                    <td>{date}</td>
+                    <td>{proof}</td>
+                </tr>'''.format
+
+_SIMPLE_HISTORY_ROW = '''
+                <tr>
+                    <td>{player}</td>
+                    <td>{score}</td>
+                    <td>{date}</td>
+                    <td>{proof}</td>
+                </tr>'''.format
+
+_SIMPLE_STATS_ROW = '''
+                <tr>
+                    <td>{name}</td>
+                    <td>{first_days}</td>
+                    <td>{top_days}</td>
+                </tr>'''.format
+
+_ADVANCED_RECORD_ROW = '''
+            <tr data-proof="{proof_type}">
+                <td>{player}</td>
+                <td>{score}</td>
+                <td>{event1}</td>
+                <td>{event2}</td>
+                <td>{event3}</td>
+                <td>{bonus}</td>
+                <td>{date}</td>
+                <td>{proof}</td>
+            </tr>'''.format
+
+_ADVANCED_STATS_ROW = '''
+            <tr>
+                <td>{name}</td>
+                <td>{first_days}</td>
+                <td>{top_days}</td>
+            </tr>'''.format
+
+_SIMPLE_RANKING_ROW = '''
+                <tr>
+                    <td>{rank}</td>
+                    <td>{player}</td>
+                    <td>{score}</td>
+                    <td>{date}</td>
+                    <td>{proof}</td>
+                    <td>{change}</td>
+                    <td>{percentile}</td>
+                </tr>'''.format
+
+_ADVANCED_RANKING_ROW = '''
+            <tr>
+                <td>{rank}</td>
+                <td>{player}</td>
+                <td>{score}</td>
+                <td>{date}</td>
+                <td>{proof}</td>
+                <td>{change}</td>
+                <td>{percentile}</td>
+            </tr>'''.format
+
+# Proof filter of the course pages, driven by js/sorting-logic.js
+_PROOF_FILTER = '''
+
+    <div class="filter-container">
+        <h3>Filter by Proof Type</h3>
+        <div class="filter-options">
+            <div class="filter-option">
+                <input type="radio" id="all-record" name="proofFilter" value="all-record" checked>
+                <label for="all-record">ALL RECORDS</label>
+            </div>
+            <div class="filter-option">
+                <input type="radio" id="verified-record" name="proofFilter" value="verified-record">
+                <label for="verified-record">VERIFIED RECORD</label>
+            </div>
+            <div class="filter-option">
+                <input type="radio" id="photo" name="proofFilter" value="photo">
+                <label for="photo">PHOTO</label>
+            </div>
+            <div class="filter-option">
+                <input type="radio" id="video" name="proofFilter" value="video">
+                <label for="video">VIDEO</label>
+            </div>
+            <div class="filter-option">
+                <input type="radio" id="livestream" name="proofFilter" value="livestream">
+                <label for="livestream">LIVESTREAM</label>
+            </div>
+        </div>
+        <div class="filter-info">
+            Choose how strict you want the proof requirements to be.
+        </div>
+    </div>
+    <div class="stats" id="stats">
+        Showing verified records
+    </div>'''
+
+def _advanced_record_row(record):
+    """Render one course submission as a history/current-record table row"""
+    proof_type = get_proof_type(record.photo, record.link)
+    return _ADVANCED_RECORD_ROW(
+        proof_type=proof_type,
+        player=record.player,
+        score=int(record.total_score),
+        event1=int(record.event1) if record.event1 else '--',
+        event2=int(record.event2) if record.event2 else '--',
+        event3=int(record.event3) if record.event3 else '--',
+        bonus=int(record.bonus_points) if record.bonus_points else '--',
+        date=record.date.strftime("%d/%m/%Y"),
+        proof=format_proof_link(record.link, proof_type)
+    )
+
+SHARD_DIR = 'shards'
+
+def _score_text(score):
+    return f'{score:g}'
+
+def render_historical_standings(top3_changes, top_k=3):
+    """Yield a table of the top K at the end of every year"""
+    year_ends = Standings.from_changes(top3_changes).year_ends()
+    if not year_ends:
+        return
+    headers = ''.join(f'\n                    <th>#{position}</th>' for position in range(1, top_k + 1))
+    yield f'''
+
+    <h2>Historical Standings</h2>
+    <div class="table-wrapper">
+        <table>
+            <thead>
+                <tr>
+                    <th>End of</th>{headers}
+                </tr>
+            </thead>
+            <tbody>'''
+    for year, board in year_ends:
+        cells = ''.join(f'\n                    <td>{player} ({_score_text(score)})</td>' for _, player, score, _ in board)
+        cells += '\n                    <td>–</td>' * (top_k - len(board))
+        yield f'''
+                <tr>
+                    <td>{year}</td>{cells}
+                </tr>'''
+    yield '''
+            </tbody>
+        </table>
+    </div>'''
+
+def record_history(all_records, top3_changes):
+    """The submissions that changed the top K, in file order"""
     improvement_rows = set(row_num for row_num, _, _ in top3_changes)
-    record_history = [r for r in all_records if r['row_num'] in improvement_rows]
+    return [r for r in all_records if r.row_num in improvement_rows]
+
+def tier_analysis(all_records, top3_changes, first_holder_days, top23_presence_days, lower_is_better=False):
+    """TierAnalysis of an unfiltered leaderboard"""
+    current_record = (min if lower_is_better else max)(all_records, key=lambda x: x.total_score) if all_records else None
+    return TierAnalysis(current_record, record_history(all_records, top3_changes), first_holder_days, top23_presence_days)
+
+def ranked_names(first_holder_days, top23_presence_days):
+    """Players of the statistics table, most days in the top K first"""
+    # Ordered union so players tied on days always come out in the same order
+    all_names = list(dict.fromkeys([*first_holder_days, *top23_presence_days]))
+    return sorted(all_names, key=lambda n: -top23_presence_days.get(n, 0))
+
+def previous_rankings(json_file):
+    """Per tier, the ranks saved in a page's data file by the last build and the ranks those were compared against
+
+    Both map player names to ranks; an empty dict is returned when there is no data file yet.
+    """
+    try:
+        with open(json_file, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    players, rows = data['players'], data['rows']
+    previous = {}
+    for tier, tier_data in data['tiers'].items():
+        ranking = tier_data.get('ranking')
+        if ranking is None:
+            continue
+        names = [players[rows['player'][code]] for code in ranking['row']]
+        previous[tier] = (dict(zip(names, ranking['rank'])),
+                          {name: rank for name, rank in zip(names, ranking['previous']) if rank is not None})
+    return previous
+
+def page_rankings(personal_bests, previous):
+    """Rank the personal bests of every tier (see analyze_leaderboard) against previous (see previous_rankings)
+
+    Ranks are compared with the last build's, or with what those were compared
+    against when no rank moved since, so rebuilding a page keeps its changes.
+    """
+    rankings = {}
+    for tier, bests in personal_bests.items():
+        ranked = bests.ranked()
+        ranks = {record.player: rank for rank, record in ranked}
+        last_ranks, last_baseline = previous.get(tier, (ranks, ranks))
+        baseline = last_baseline if ranks == last_ranks else last_ranks
+        # Share of the ranked players this best is at least as good as
+        rankings[tier] = [RankedBest(rank, record, round(100 * (len(ranked) - rank + 1) / len(ranked), 1), baseline.get(record.player))
+                          for rank, record in ranked]
+    return rankings
+
+def rank_change(entry):
+    """Movement of a ranked player: ▲ up, ▼ down, – unchanged, NEW if they were not ranked"""
+    if entry.previous is None:
+        return 'NEW'
+    moved = entry.previous - entry.rank
+    return f'▲{moved}' if moved > 0 else f'▼{-moved}' if moved < 0 else '–'
+
+def split_pages(items, page_size, keep_last=False):
+    """Split table rows into the rows shown on the page and older shards of page_size rows
+
+    With keep_last, the page keeps the last rows (the most recent history) and
+    shard 1 holds the rows just before them.
+    """
+    if not page_size or len(items) <= page_size:
+        return items, []
+    if keep_last:
+        rest = items[:-page_size]
+        return items[-page_size:], [rest[max(0, end - page_size):end] for end in range(len(rest), 0, -page_size)]
+    rest = items[page_size:]
+    return items[:page_size], [rest[i:i + page_size] for i in range(0, len(rest), page_size)]
+
+def shard_prefix(tier):
+    """Shard tables of the unfiltered tier keep the plain history/stats names"""
+    return '' if tier == ALL_TIER else f'{tier}-'
+
+def shard_name(page_stem, table, number):
+    return f'{page_stem}-{table}-{number}.html'
+
+def _shard_nav(page_stem, table, count, label, position, indent):
+    """Button loading a table's shards on demand (see js/pagination.js)"""
+    urls = ' '.join(f'{SHARD_DIR}/{shard_name(page_stem, table, n)}' for n in range(1, count + 1))
+    return f'''
+{indent}<div class="shard-nav" data-shards="{urls}" data-position="{position}">
+{indent}    <button type="button" class="load-shard">{label}</button>
+{indent}</div>'''
+
+def _simple_history_rows(records):
+    for record in records:
+        proof_type = get_proof_type(record.photo, record.link)
+        yield _SIMPLE_HISTORY_ROW(
+            player=record.player,
+            score=record.total_score,
+            date=record.date.strftime("%d/%m/%Y"),
+            proof=format_proof_link(record.link, proof_type, is_event=True)
+        )
+
+def _simple_stats_rows(names, first_holder_days, top23_presence_days):
+    for name in names:
+        yield _SIMPLE_STATS_ROW(name=name, first_days=first_holder_days.get(name, 0), top_days=top23_presence_days.get(name, 0))
+
+def _advanced_history_rows(records):
+    for record in records:
+        yield _advanced_record_row(record)
+
+def _advanced_stats_rows(names, first_holder_days, top23_presence_days):
+    for name in names:
+        yield _ADVANCED_STATS_ROW(name=name, first_days=first_holder_days.get(name, 0), top_days=top23_presence_days.get(name, 0))
+
+def _simple_ranking_rows(ranking):
+    for entry in ranking:
+        record = entry.record
+        yield _SIMPLE_RANKING_ROW(
+            rank=entry.rank,
+            player=record.player,
+            score=record.total_score,
+            date=record.date.strftime("%d/%m/%Y"),
+            proof=format_proof_link(record.link, get_proof_type(record.photo, record.link), is_event=True),
+            change=rank_change(entry),
+            percentile=f'{entry.percentile:g}'
+        )
+
+def _advanced_ranking_rows(ranking):
+    for entry in ranking:
+        record = entry.record
+        yield _ADVANCED_RANKING_ROW(
+            rank=entry.rank,
+            player=record.player,
+            score=int(record.total_score),
+            date=record.date.strftime("%d/%m/%Y"),
+            proof=format_proof_link(record.link, get_proof_type(record.photo, record.link)),
+            change=rank_change(entry),
+            percentile=f'{entry.percentile:g}'
+        )
+
+def render_shards(html_style, proof_tiers, page_size, rankings=None):
+    """Yield (table, shard number, row fragments) for the rows left off a paginated page"""
+    history_rows, stats_rows = (_simple_history_rows, _simple_stats_rows) if html_style == "simple" else (_advanced_history_rows, _advanced_stats_rows)
+    ranking_rows = _simple_ranking_rows if html_style == "simple" else _advanced_ranking_rows
+    for tier, analysis in proof_tiers.items():
+        prefix = shard_prefix(tier)
+        _, ranking_shards = split_pages((rankings or {}).get(tier, []), page_size)
+        for number, ranking in enumerate(ranking_shards, 1):
+            yield f'{prefix}ranking', number, ranking_rows(ranking)
+        _, history_shards = split_pages(analysis.history, page_size, keep_last=True)
+        for number, records in enumerate(history_shards, 1):
+            yield f'{prefix}history', number, history_rows(records)
+        _, stats_shards = split_pages(ranked_names(analysis.first_holder_days, analysis.top_presence_days), page_size)
+        for number, names in enumerate(stats_shards, 1):
+            yield f'{prefix}stats', number, stats_rows(names, analysis.first_holder_days, analysis.top_presence_days)
+
+def remove_stale_pages(pattern, kept):
+    """Delete the pages matching a glob pattern that are not in kept, with their .gz siblings"""
+    # Siblings are matched on their own too, in case their page is already gone
+    for path in glob.glob(pattern) + glob.glob(pattern + '.gz'):
+        page = path[:-3] if path.endswith('.gz') else path
+        if page not in kept:
+            os.remove(path)
+
+def write_shards(output_file, shards):
+    """Write a page's shards next to it, removing shards left over from a longer build"""
+    directory = os.path.join(os.path.dirname(output_file), SHARD_DIR)
+    page_stem = os.path.splitext(os.path.basename(output_file))[0]
+    written = set()
+    for table, number, fragments in shards:
+        os.makedirs(directory, exist_ok=True)
+        shard_file = os.path.join(directory, shard_name(page_stem, table, number))
+        write_page(shard_file, fragments)
+        written.add(shard_file)
+    for table in [f'{shard_prefix(tier)}{name}' for tier in PROOF_TIERS for name in ('ranking', 'history', 'stats')]:
+        remove_stale_pages(os.path.join(directory, shard_name(page_stem, table, '*')), written)
+
+def write_assets(stats=None):
+    """Write the fingerprinted JS and CSS bundles, removing those of previous builds"""
+    os.makedirs(assets.ASSETS_DIR, exist_ok=True)
+    written = set()
+    for name in assets.BUNDLES:
+        file_name, data = assets.bundle(name)
+        asset_file = os.path.join(assets.ASSETS_DIR, file_name)
+        write_page(asset_file, [data], stats)
+        written.update([asset_file, asset_file + '.gz'])
+    for stale in glob.glob(os.path.join(assets.ASSETS_DIR, '*')):
+        if stale not in written:
+            os.remove(stale)
+
+PID_INDEX = 'calculators/pid-index.json'
+
+def generate_pid_index(stats=None):
+    """Write the day masks calculators/PID.html answers its queries from"""
+    write_page(PID_INDEX, [json.dumps(pid_solver.pid_index(), separators=(',', ':'))], stats)
+
+def render_simple_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, lower_is_better=False, top_k=3, page_size=0, page_stem=None, ranking=None):
+    """Yield the fragments of an event page; with page_size, long tables only show their first shard"""
+    current_record = (min if lower_is_better else max)(all_records, key=lambda x: x.total_score) if all_records else None
+    ranking, ranking_shards = split_pages(ranking or [], page_size)
+    history, history_shards = split_pages(record_history(all_records, top3_changes), page_size, keep_last=True)
+    names, stats_shards = split_pages(ranked_names(first_holder_days, top23_presence_days), page_size)
     
-    html_content = f'''<!DOCTYPE html>
+    yield f'''<!DOCTYPE html>
 <html>
 <head>
     <title>{course_name} - Pokeathlon WRs</title>
-    <link rel="stylesheet" href="../style.css" />
+    <link rel="stylesheet" href="{assets.url('style.css', '../')}" />
     <meta name="viewport" content="width=device-width, initial-scale=1.0" />
     <link rel="icon" href="../championship-trophy.svg" type="image/svg+xml">
 </head>
@@ -173,21 +1094,46 @@ def generate_simple_html(course_name, all_records, top3_changes, first_holder_da
             <tbody>'''
     
     if current_record:
-        proof_type = get_proof_type(current_record['photo'], current_record['link'])
-        proof_link = format_proof_link(current_record['link'], proof_type, is_event=True)
-        html_content += f'''
-                <tr>
-                    <td>{current_record['total_score']}</td>
-                    <td>{current_record['player']}</td>
-                    <td>{current_record['date'].strftime("%Y-%m-%d")}</td>
-                    <td>{proof_link}</td>
-                </tr>'''
+        proof_type = get_proof_type(current_record.photo, current_record.link)
+        yield _SIMPLE_CURRENT_ROW(
+            score=current_record.total_score,
+            player=current_record.player,
+            date=current_record.date.strftime("%Y-%m-%d"),
+            proof=format_proof_link(current_record.link, proof_type, is_event=True)
+        )
     
-    html_content += '''
+    yield '''
             </tbody>
         </table>
     </div>
 
+    <h2>Ranking</h2>
+    <div class="table-wrapper">
+        <table>
+            <thead>
+                <tr>
+                    <th>Rank</th>
+                    <th>Player</th>
+                    <th>Personal Best</th>
+                    <th>Date</th>
+                    <th>Proof</th>
+                    <th>Change</th>
+                    <th>Percentile</th>
+                </tr>
+            </thead>
+            <tbody>'''
+
+    yield from _simple_ranking_rows(ranking)
+
+    yield '''
+            </tbody>
+        </table>
+    </div>'''
+    if ranking_shards:
+        yield _shard_nav(page_stem, 'ranking', len(ranking_shards), 'Show more players', 'after', '    ')
+
+    yield '''
+
     <h2>Record History</h2>
     <div class="table-wrapper">
         <table>
@@ -201,21 +1147,16 @@ def generate_simple_html(course_name, all_records, top3_changes, first_holder_da
             </thead>
             <tbody>'''
     
-    for record in record_history:
-        proof_type = get_proof_type(record['photo'], record['link'])
-        proof_link = format_proof_link(record['link'], proof_type, is_event=True)
-        html_content += f'''
-                <tr>
-                    <td>{record['player']}</td>
-                    <td>{record['total_score']}</td>
-                    <td>{record['date'].strftime("%d/%m/%Y")}</td>
-                    <td>{proof_link}</td>
-                </tr>'''
+    yield from _simple_history_rows(history)
     
-    html_content += '''
+    yield '''
             </tbody>
         </table>
-    </div>
+    </div>'''
+    if history_shards:
+        yield _shard_nav(page_stem, 'history', len(history_shards), 'Load older records', 'before', '    ')
+
+    yield f'''
 
     <h2>Leaderboard Statistics</h2>
     <div class="table-wrapper">
@@ -224,95 +1165,42 @@ def generate_simple_html(course_name, all_records, top3_changes, first_holder_da
                 <tr>
                     <th>Name</th>
                     <th>Number of days at #1</th>
-                    <th>Number of days in Top 3</th>
+                    <th>Number of days in Top {top_k}</th>
                 </tr>
             </thead>
             <tbody>'''
     
-    all_names = set(first_holder_days.keys()) | set(top23_presence_days.keys())
-    for name in sorted(all_names, key=lambda n: -top23_presence_days.get(n, 0)):
-        html_content += f'''
-                <tr>
-                    <td>{name}</td>
-                    <td>{first_holder_days.get(name, 0)}</td>
-                    <td>{top23_presence_days.get(name, 0)}</td>
-                </tr>'''
+    yield from _simple_stats_rows(names, first_holder_days, top23_presence_days)
     
-    html_content += '''
+    yield '''
             </tbody>
         </table>
-    </div>
-    <script src="../js/tablesort.min.js"></script>
-    <script src="../js/tablesort.number.min.js"></script>
-    <script src="../js/tablesort.date.js"></script>
-    <script src="../js/theme-toggle.js"></script>
-    <script>
-        document.querySelectorAll('table').forEach(table => {
-            const sort = new Tablesort(table);
-        });
-    </script>
-</body>
-</html>'''
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    </div>'''
+    if stats_shards:
+        yield _shard_nav(page_stem, 'stats', len(stats_shards), 'Show more players', 'after', '    ')
 
-def generate_advanced_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, output_file, event1_name=None, event2_name=None, event3_name=None):
-    """Generate advanced HTML file for courses with filtering"""
-    current_record = max(all_records, key=lambda x: x['total_score']) if all_records else None
-    improvement_rows = set(row_num for row_num, _, _ in top3_changes)
-    record_history = [r for r in all_records if r['row_num'] in improvement_rows]
+    yield from render_historical_standings(top3_changes, top_k)
 
-    html_content = f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>{course_name} - Pokéathlon WRs</title>
-    <link rel="stylesheet" href="../style.css">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <link rel="icon" href="../championship-trophy.svg" type="image/svg+xml">
-</head>
-<body>
-    <button id="themeToggle" class="theme-toggle" aria-label="Toggle dark/light theme">🌙</button>
-    <nav><a href="../index.html">← Back to All Events</a></nav>
+    yield f'''
+    <script src="{assets.url('page.js', '../')}"></script>
+</body>
+</html>'''
 
-    <h1>{course_name}</h1>
+def generate_simple_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, output_file, lower_is_better=False, top_k=3, stats=None, page_size=0, ranking=None):
+    """Generate simple HTML file for events"""
+    page_stem = os.path.splitext(os.path.basename(output_file))[0]
+    write_page(output_file, render_simple_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, lower_is_better, top_k, page_size, page_stem, ranking), stats)
+    proof_tiers = {ALL_TIER: tier_analysis(all_records, top3_changes, first_holder_days, top23_presence_days, lower_is_better)}
+    write_shards(output_file, render_shards("simple", proof_tiers, page_size, {ALL_TIER: ranking or []}))
 
-    <div class="filter-container">
-        <h3>Filter by Proof Type</h3>
-        <div class="filter-options">
-            <div class="filter-option">
-                <input type="radio" id="all-record" name="proofFilter" value="all-record" checked>
-                <label for="all-record">ALL RECORDS</label>
-            </div>
-            <div class="filter-option">
-                <input type="radio" id="verified-record" name="proofFilter" value="verified-record">
-                <label for="verified-record">VERIFIED RECORD</label>
-            </div>
-            <div class="filter-option">
-                <input type="radio" id="photo" name="proofFilter" value="photo">
-                <label for="photo">PHOTO</label>
-            </div>
-            <div class="filter-option">
-                <input type="radio" id="video" name="proofFilter" value="video">
-                <label for="video">VIDEO</label>
-            </div>
-            <div class="filter-option">
-                <input type="radio" id="livestream" name="proofFilter" value="livestream">
-                <label for="livestream">LIVESTREAM</label>
-            </div>
-        </div>
-        <div class="filter-info">
-            Choose how strict you want the proof requirements to be.
-        </div>
-    </div>
-    <div class="stats" id="stats">
-        Showing verified records
-    </div>'''
+def _render_advanced_tier(analysis, event1_name, event2_name, event3_name, top_k, page_size, page_stem, table_prefix='', ranking=None):
+    """Yield the current record, ranking, record history and statistics tables of one proof tier"""
+    ranking, ranking_shards = split_pages(ranking or [], page_size)
+    history, history_shards = split_pages(analysis.history, page_size, keep_last=True)
+    names, stats_shards = split_pages(ranked_names(analysis.first_holder_days, analysis.top_presence_days), page_size)
 
-    if current_record:
-        proof_type = get_proof_type(current_record['photo'], current_record['link'])
-        proof_link = format_proof_link(current_record['link'], proof_type)
-        html_content += f'''
+    if analysis.current:
+        yield f'''
     
     <h2>Current Record</h2>
     <div class="table-wrapper">
@@ -320,31 +1208,55 @@ def generate_advanced_html(course_name, all_records, top3_changes, first_holder_
         <thead>
             <tr>
                 <th>Player</th>
-                <th>Total Score</th>
-                <th>{event1_name or "Event 1"}</th>
-                <th>{event2_name or "Event 2"}</th>
-                <th>{event3_name or "Event 3"}</th>
-                <th>Bonus Points</th>
+                <th>Total Score</th>
+                <th>{event1_name or "Event 1"}</th>
+                <th>{event2_name or "Event 2"}</th>
+                <th>{event3_name or "Event 3"}</th>
+                <th>Bonus Points</th>
+                <th>Date</th>
+                <th>Proof</th>
+            </tr>
+        </thead>
+        <tbody>'''
+        yield _advanced_record_row(analysis.current)
+        yield '''
+        </tbody>
+    </table>
+    </div>'''
+    else:
+        yield '''
+
+    <p class="no-records">No submission with this proof type yet.</p>'''
+
+    if ranking:
+        yield '''
+
+    <h2>Ranking</h2>
+    <div class="table-wrapper">
+    <table>
+        <thead>
+            <tr>
+                <th data-sort-method='number'>Rank</th>
+                <th>Player</th>
+                <th data-sort-method='number'>Personal Best</th>
                 <th>Date</th>
                 <th>Proof</th>
+                <th>Change</th>
+                <th data-sort-method='number'>Percentile</th>
             </tr>
         </thead>
-        <tbody>
-            <tr data-proof="{proof_type}">
-                <td>{current_record['player']}</td>
-                <td>{int(current_record['total_score'])}</td>
-                <td>{int(current_record['event1']) if current_record['event1'] else '--'}</td>
-                <td>{int(current_record['event2']) if current_record['event2'] else '--'}</td>
-                <td>{int(current_record['event3']) if current_record['event3'] else '--'}</td>
-                <td>{int(current_record['bonus_points']) if current_record['bonus_points'] else '--'}</td>
-                <td>{current_record['date'].strftime("%d/%m/%Y")}</td>
-                <td>{proof_link}</td>
-            </tr>
+        <tbody>'''
+
+        yield from _advanced_ranking_rows(ranking)
+
+        yield '''
         </tbody>
     </table>
     </div>'''
+        if ranking_shards:
+            yield _shard_nav(page_stem, f'{table_prefix}ranking', len(ranking_shards), 'Show more players', 'after', '    ')
 
-    html_content += f'''
+    yield f'''
 
     <h2>Record History</h2>
     <div class="table-wrapper">
@@ -363,29 +1275,17 @@ def generate_advanced_html(course_name, all_records, top3_changes, first_holder_
         </thead>
         <tbody>'''
 
-    for record in record_history:
-        proof_type = get_proof_type(record['photo'], record['link'])
-        proof_link = format_proof_link(record['link'], proof_type)
-        html_content += f'''
-            <tr data-proof="{proof_type}">
-                <td>{record['player']}</td>
-                <td>{int(record['total_score'])}</td>
-                <td>{int(record['event1']) if record['event1'] else '--'}</td>
-                <td>{int(record['event2']) if record['event2'] else '--'}</td>
-                <td>{int(record['event3']) if record['event3'] else '--'}</td>
-                <td>{int(record['bonus_points']) if record['bonus_points'] else '--'}</td>
-                <td>{record['date'].strftime("%d/%m/%Y")}</td>
-                <td>{proof_link}</td>
-            </tr>'''
-
-    html_content += '''
+    yield from _advanced_history_rows(history)
+
+    yield '''
         </tbody>
     </table>
     </div>'''
+    if history_shards:
+        yield _shard_nav(page_stem, f'{table_prefix}history', len(history_shards), 'Load older records', 'before', '    ')
 
-    all_names = set(first_holder_days.keys()) | set(top23_presence_days.keys())
-    if all_names:
-        html_content += '''
+    if names:
+        yield f'''
 
     <h2>Leaderboard Statistics</h2>
     <div class="table-wrapper">
@@ -394,56 +1294,312 @@ def generate_advanced_html(course_name, all_records, top3_changes, first_holder_
             <tr>
                 <th>Player</th>
                 <th data-sort-method='number'>Number of days at #1</th>
-                <th data-sort-method='number'>Number of days in Top 3 (positions 2-3)</th>
+                <th data-sort-method='number'>Number of days in Top {top_k} (positions 2-{top_k})</th>
             </tr>
         </thead>
         <tbody>'''
 
-        for name in sorted(all_names, key=lambda n: -top23_presence_days.get(n, 0)):
-            html_content += f'''
-            <tr>
-                <td>{name}</td>
-                <td>{first_holder_days.get(name, 0)}</td>
-                <td>{top23_presence_days.get(name, 0)}</td>
-            </tr>'''
+        yield from _advanced_stats_rows(names, analysis.first_holder_days, analysis.top_presence_days)
 
-        html_content += '''
+        yield '''
         </tbody>
     </table>
     </div>'''
+        if stats_shards:
+            yield _shard_nav(page_stem, f'{table_prefix}stats', len(stats_shards), 'Show more players', 'after', '    ')
+
+def render_advanced_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, event1_name=None, event2_name=None, event3_name=None, top_k=3, page_size=0, page_stem=None, proof_tiers=None, rankings=None):
+    """Yield the fragments of a course page with filtering; with page_size, long tables only show their first shard
+
+    With proof_tiers (see analyze_leaderboard), every proof filter gets its own
+    precomputed tables and js/sorting-logic.js only switches between them.
+    rankings maps tiers to their ranking (see page_rankings).
+    """
+    if proof_tiers is None:
+        proof_tiers = {ALL_TIER: tier_analysis(all_records, top3_changes, first_holder_days, top23_presence_days)}
+    rankings = rankings or {}
+
+    yield f'''<!DOCTYPE html>
+<html>
+<head>
+    <title>{course_name} - Pokéathlon WRs</title>
+    <link rel="stylesheet" href="{assets.url('style.css', '../')}">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="icon" href="../championship-trophy.svg" type="image/svg+xml">
+</head>
+<body>
+    <button id="themeToggle" class="theme-toggle" aria-label="Toggle dark/light theme">🌙</button>
+    <nav><a href="../index.html">← Back to All Events</a></nav>
+
+    <h1>{course_name}</h1>'''
+    yield _PROOF_FILTER
+
+    if len(proof_tiers) == 1:
+        yield from _render_advanced_tier(proof_tiers[ALL_TIER], event1_name, event2_name, event3_name, top_k, page_size, page_stem, '', rankings.get(ALL_TIER))
+    else:
+        for tier, analysis in proof_tiers.items():
+            yield f'''
+
+    <section class="proof-tier" data-tier="{tier}"{'' if tier == ALL_TIER else ' hidden'}>'''
+            yield from _render_advanced_tier(analysis, event1_name, event2_name, event3_name, top_k, page_size, page_stem, shard_prefix(tier), rankings.get(tier))
+            yield '''
+    </section>'''
 
-    html_content += '''
-    <script src="../js/tablesort.min.js"></script>
-    <script src="../js/tablesort.number.min.js"></script>
-    <script src="../js/tablesort.date.js"></script>
-    <script src="../js/sorting-logic.js"></script>
-    <script src="../js/theme-toggle.js"></script>
-    <script>
-        document.querySelectorAll('table').forEach(table => {
-            const sort = new Tablesort(table);
-        });
-    </script>
+    # Standings are over all submissions, whatever the proof filter
+    yield from render_historical_standings(top3_changes, top_k)
+
+    yield f'''
+    <script src="{assets.url('page.js', '../')}"></script>
 </body>
 </html>'''
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+def generate_advanced_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, output_file, event1_name=None, event2_name=None, event3_name=None, top_k=3, stats=None, page_size=0, proof_tiers=None, rankings=None):
+    """Generate advanced HTML file for courses with filtering"""
+    page_stem = os.path.splitext(os.path.basename(output_file))[0]
+    if proof_tiers is None:
+        proof_tiers = {ALL_TIER: tier_analysis(all_records, top3_changes, first_holder_days, top23_presence_days)}
+    write_page(output_file, render_advanced_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, event1_name, event2_name, event3_name, top_k, page_size, page_stem, proof_tiers, rankings), stats)
+    write_shards(output_file, render_shards("advanced", proof_tiers, page_size, rankings))
+
+# Proof type codes of the JSON data files, indexed by position
+PROOF_TYPES = ['claimed', 'photo', 'video', 'livestream']
+
+def data_file(output_file):
+    """The JSON data file written next to a leaderboard page"""
+    return os.path.splitext(output_file)[0] + '.json'
+
+def leaderboard_data(course_name, html_style, proof_tiers, lower_is_better=False, top_k=3, event_names=None, standings=None, rankings=None):
+    """Columnar view of a page's tables: rows and player names are stored once and referenced by index"""
+    rankings = rankings or {}
+    # Every tier's history and personal bests are submissions, so one row table serves them all
+    rows = {r.row_num: r for analysis in proof_tiers.values() for r in analysis.history}
+    rows.update((entry.record.row_num, entry.record) for ranking in rankings.values() for entry in ranking)
+    rows = sorted(rows.values(), key=lambda r: r.row_num)
+    row_codes = {r.row_num: code for code, r in enumerate(rows)}
+    tier_names = {tier: ranked_names(analysis.first_holder_days, analysis.top_presence_days) for tier, analysis in proof_tiers.items()}
+    players = list(dict.fromkeys([*(r.player for r in rows), *(name for names in tier_names.values() for name in names)]))
+    player_codes = {name: code for code, name in enumerate(players)}
+    proof_codes = {proof_type: code for code, proof_type in enumerate(PROOF_TYPES)}
+
+    columns = {
+        'row': [r.row_num for r in rows],
+        'player': [player_codes[r.player] for r in rows],
+        'score': [r.total_score for r in rows],
+        'date': [r.date.isoformat() for r in rows],
+        'proof': [proof_codes[get_proof_type(r.photo, r.link)] for r in rows],
+        'link': [r.link for r in rows]
+    }
+    if html_style == "advanced":
+        columns.update(
+            event1=[r.event1 for r in rows],
+            event2=[r.event2 for r in rows],
+            event3=[r.event3 for r in rows],
+            bonus=[r.bonus_points for r in rows]
+        )
+    tiers = {}
+    for tier, analysis in proof_tiers.items():
+        names = tier_names[tier]
+        tiers[tier] = {
+            # The current record always entered the top K, so it is one of the history rows
+            'current': row_codes[analysis.current.row_num] if analysis.current else None,
+            'history': [row_codes[r.row_num] for r in analysis.history],
+            'stats': {
+                'player': [player_codes[name] for name in names],
+                'first_days': [analysis.first_holder_days.get(name, 0) for name in names],
+                'top_days': [analysis.top_presence_days.get(name, 0) for name in names]
+            }
+        }
+        if tier in rankings:
+            ranking = rankings[tier]
+            tiers[tier]['ranking'] = {
+                'row': [row_codes[entry.record.row_num] for entry in ranking],
+                'rank': [entry.rank for entry in ranking],
+                'percentile': [entry.percentile for entry in ranking],
+                'previous': [entry.previous for entry in ranking]
+            }
+    data = {
+        'name': course_name,
+        'style': html_style,
+        'lower_is_better': lower_is_better,
+        'top_k': top_k,
+        'proof_types': PROOF_TYPES,
+        'players': players,
+        'rows': columns,
+        'tiers': tiers
+    }
+    if event_names:
+        data['events'] = list(event_names)
+    if standings is not None:
+        # Every board entry once changed the board, so it is one of the history rows
+        data['standings'] = {
+            'dates': [day.isoformat() for day in standings.dates],
+            'boards': [[row_codes[row_num] for row_num, _, _, _ in board] for board in standings.boards]
+        }
+    return data
+
+def standings_from_data(data):
+    """Rebuild the Standings saved in a leaderboard's JSON data file"""
+    rows = data['rows']
+    entries = [
+        (row_num, data['players'][player], score, datetime.strptime(day, '%Y-%m-%d').date())
+        for row_num, player, score, day in zip(rows['row'], rows['player'], rows['score'], rows['date'])
+    ]
+    standings = data['standings']
+    return Standings(
+        [datetime.strptime(day, '%Y-%m-%d').date() for day in standings['dates']],
+        [[entries[code] for code in board] for board in standings['boards']]
+    )
+
+def leaderboard_config(name):
+    """Find an event or course configuration by name, ignoring case; returns (name, html_style, config)"""
+    for job_name, html_style, config in [(n, "simple", c) for n, c in EVENTS_CONFIG.items()] + [(n, "advanced", c) for n, c in COURSES_CONFIG.items()]:
+        if job_name.lower() == name.lower():
+            return job_name, html_style, config
+    raise KeyError(f"Unknown leaderboard: {name}")
+
+def load_standings(name, dataset=None, engine='python'):
+    """Standings of a leaderboard, read from its data file when the page has been built, else replayed from the CSV"""
+    name, html_style, config = leaderboard_config(name)
+    json_file = data_file(config['output_file'])
+    if os.path.exists(json_file):
+        with open(json_file, encoding='utf-8') as f:
+            data = json.load(f)
+        if 'standings' in data:
+            return standings_from_data(data)
+    csv_file = EVENTS_CSV if html_style == "simple" else config['csv_file']
+    _, top3_changes, _, _, _ = analyze_leaderboard(
+        csv_file, config['score_col'], config['date_col'], config['link_col'], config.get('lower_is_better', False),
+        dataset=dataset, top_k=config.get('top_k', 3), engine=engine
+    )
+    return Standings.from_changes(top3_changes)
+
+def generate_data_json(output_file, data, stats=None):
+    """Write a leaderboard's data file as compact JSON"""
+    write_page(output_file, [json.dumps(data, ensure_ascii=False, separators=(',', ':'))], stats)
+
+_SHELL_TABLE = '''
+
+    <h2>{title}</h2>
+    <div class="table-wrapper">
+        <table>
+            <thead>
+                <tr>{headers}
+                </tr>
+            </thead>
+            <tbody id="{table_id}"></tbody>
+        </table>
+    </div>'''.format
+
+_SHELL_HEADER = '''
+                    <th{sort}>{header}</th>'''.format
+
+def _shell_table(title, table_id, headers):
+    cells = ''.join(_SHELL_HEADER(header=header, sort=f" data-sort-method='{sort}'" if sort else '') for header, sort in headers)
+    return _SHELL_TABLE(title=title, table_id=table_id, headers=cells)
+
+def render_shell_html(course_name, html_style, data_url, top_k=3, event_names=None):
+    """Yield a slim page whose tables are filled in by js/leaderboard-data.js from the JSON data file"""
+    event1_name, event2_name, event3_name = event_names or (None, None, None)
+    title = course_name if html_style == "advanced" else f'{course_name} WR'
+    yield f'''<!DOCTYPE html>
+<html>
+<head>
+    <title>{course_name} - Pokéathlon WRs</title>
+    <link rel="stylesheet" href="{assets.url('style.css', '../')}">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="icon" href="../championship-trophy.svg" type="image/svg+xml">
+</head>
+<body>
+    <button id="themeToggle" class="theme-toggle" aria-label="Toggle dark/light theme">🌙</button>
+    <nav><a href="../index.html">← Back to All Events</a></nav>
+
+    <h1>{title}</h1>'''
+    if html_style == "advanced":
+        yield _PROOF_FILTER
+        record_headers = [('Player', None), ('Total Score', 'number'), (event1_name or 'Event 1', 'number'), (event2_name or 'Event 2', 'number'),
+                          (event3_name or 'Event 3', 'number'), ('Bonus Points', 'number'), ('Date', None), ('Proof', None)]
+        yield _shell_table('Current Record', 'current-record', [(header, None) for header, _ in record_headers])
+        yield _shell_table('Ranking', 'leaderboard-ranking', [
+            ('Rank', 'number'), ('Player', None), ('Personal Best', 'number'), ('Date', None), ('Proof', None), ('Change', None), ('Percentile', 'number')
+        ])
+        yield _shell_table('Record History', 'record-history', record_headers)
+        yield _shell_table('Leaderboard Statistics', 'leaderboard-stats', [
+            ('Player', None), ('Number of days at #1', 'number'), (f'Number of days in Top {top_k} (positions 2-{top_k})', 'number')
+        ])
+    else:
+        yield _shell_table('Current Record', 'current-record', [('Score', None), ('Player', None), ('Date', None), ('Proof', None)])
+        yield _shell_table('Ranking', 'leaderboard-ranking', [
+            ('Rank', None), ('Player', None), ('Personal Best', None), ('Date', None), ('Proof', None), ('Change', None), ('Percentile', None)
+        ])
+        yield _shell_table('Record History', 'record-history', [('Player', None), ('Total Score', None), ('Date', None), ('Proof', None)])
+        yield _shell_table('Leaderboard Statistics', 'leaderboard-stats', [
+            ('Name', None), ('Number of days at #1', None), (f'Number of days in Top {top_k}', None)
+        ])
+    yield _shell_table('Historical Standings', 'historical-standings',
+                       [('End of', None)] + [(f'#{position}', None) for position in range(1, top_k + 1)])
+
+    yield f'''
+    <script src="{assets.url('shell.js', '../')}" data-src="{data_url}"></script>
+</body>
+</html>'''
 
-def generate_leaderboard_html(file_path, score_col, date_col, link_col, course_name, output_html, html_style, lower_is_better=False, event1_col=None, event2_col=None, event3_col=None, bonus_col=None, event1_name=None, event2_name=None, event3_name=None):
+def generate_leaderboard_html(file_path, score_col, date_col, link_col, course_name, output_html, html_style, lower_is_better=False, event1_col=None, event2_col=None, event3_col=None, bonus_col=None, event1_name=None, event2_name=None, event3_name=None, dataset=None, top_k=3, engine='python', stats=None, page_size=0, client_render=False):
     """Main function to analyze leaderboard and generate HTML"""
-    all_records, top3_changes, first_holder_days, top23_presence_days, record_improvements = analyze_leaderboard(
-        file_path, score_col, date_col, link_col, lower_is_better, event1_col, event2_col, event3_col, bonus_col
+    # Course pages carry precomputed tables for every proof filter
+    proof_tiers = {} if html_style == "advanced" else None
+    # Only the records that changed the top K are kept: the current record and history are among them
+    personal_bests = {}
+    records, top3_changes, first_holder_days, top23_presence_days, record_improvements = analyze_leaderboard(
+        file_path, score_col, date_col, link_col, lower_is_better, event1_col, event2_col, event3_col, bonus_col, dataset, top_k, engine, stats, proof_tiers,
+        keep_records=False, personal_bests=personal_bests
     )
+    if proof_tiers is None:
+        proof_tiers = {ALL_TIER: tier_analysis(records, top3_changes, first_holder_days, top23_presence_days, lower_is_better)}
+    # Rank changes are measured against the ranking the last build saved in the data file
+    rankings = page_rankings(personal_bests, previous_rankings(data_file(output_html)))
     
-    if html_style == "simple":
-        generate_simple_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, output_html, lower_is_better)
+    event_names = (event1_name, event2_name, event3_name) if html_style == "advanced" else None
+    standings = Standings.from_changes(top3_changes)
+    generate_data_json(data_file(output_html), leaderboard_data(course_name, html_style, proof_tiers, lower_is_better, top_k, event_names, standings, rankings), stats)
+
+    if client_render:
+        # The shell carries no rows, so there is nothing to shard
+        write_page(output_html, render_shell_html(course_name, html_style, os.path.basename(data_file(output_html)), top_k, event_names), stats)
+        write_shards(output_html, [])
+    elif html_style == "simple":
+        generate_simple_html(course_name, records, top3_changes, first_holder_days, top23_presence_days, output_html, lower_is_better, top_k, stats, page_size, rankings[ALL_TIER])
     else:
-        generate_advanced_html(course_name, all_records, top3_changes, first_holder_days, top23_presence_days, output_html, event1_name, event2_name, event3_name)
+        generate_advanced_html(course_name, records, top3_changes, first_holder_days, top23_presence_days, output_html, event1_name, event2_name, event3_name, top_k, stats, page_size, proof_tiers, rankings)
     
     return record_improvements
 
-def get_course_records():
-    """Get current world records for all courses"""
+class CourseSummary:
+    """Stream consumer over the raw rows of a course CSV keeping its best total, for the index
+
+    Rows without a date still count here; the index shows them as '--'.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.record = None
+
+    def push(self, item):
+        row_num, row = item
+        if len(row) < 7:
+            return
+        total_score = parse_number(row[1])
+        if total_score and total_score > (self.record.total_score if self.record else -1):
+            # Only a new best is parsed in full
+            _, self.record = next(parse_records(
+                [item], 2, 7, 8, self.config['event1_col'], self.config['event2_col'], self.config['event3_col'], self.config['bonus_col']
+            ))
+
+def get_course_records(dataset=None, db=None):
+    """Get current world records for all courses, from the SQLite store db if given"""
+    if db is not None:
+        return _stored_course_records(db)
+    if dataset is None:
+        dataset = Dataset()
     course_configs = {
         'Speed': {'csv_file': 'csv/Pokeathlon WRs - Speed_Course.csv', 'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6},
         'Power': {'csv_file': 'csv/Pokeathlon WRs - Power_Course.csv', 'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6},
@@ -457,48 +1613,54 @@ def get_course_records():
         csv_file = config['csv_file']
         if os.path.exists(csv_file):
             try:
-                with open(csv_file, newline='', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
-                    if len(rows) > 1:
-                        best_record = None
-                        best_score = -1
-                        
-                        for row in rows[1:]:
-                            if len(row) >= 7:
-                                try:
-                                    total_score = parse_number(row[1])
-                                    if total_score and total_score > best_score:
-                                        best_score = total_score
-                                        event1_score = parse_number(row[config['event1_col'] - 1])
-                                        event2_score = parse_number(row[config['event2_col'] - 1])
-                                        event3_score = parse_number(row[config['event3_col'] - 1])
-                                        
-                                        event1_points = int(event1_score) if event1_score else 0
-                                        event2_points = int(event2_score) if event2_score else 0
-                                        event3_points = int(event3_score) if event3_score else 0
-                                        
-                                        best_record = {
-                                            'player': row[0].strip(),
-                                            'total_score': int(total_score),
-                                            'event1_points': event1_points if event1_points > 0 else '--',
-                                            'event2_points': event2_points if event2_points > 0 else '--',
-                                            'event3_points': event3_points if event3_points > 0 else '--',
-                                            'bonus': int(parse_number(row[config['bonus_col'] - 1])) if parse_number(row[config['bonus_col'] - 1]) else '--',
-                                            'date': parse_date(row[6])
-                                        }
-                                except (ValueError, IndexError):
-                                    continue
-                        
-                        if best_record:
-                            course_records[course_name] = best_record
+                summary = CourseSummary(config)
+                consume(dataset.stream(csv_file), [summary.push])
+                if summary.record:
+                    course_records[course_name] = summary.record
             except Exception as e:
                 print(f"Warning: Could not read {csv_file}: {e}")
     
     return course_records
 
-def get_event_records():
-    """Get current world records for all events"""
+def _stored_course_records(db):
+    course_records = {}
+    for course_name in ('Speed', 'Power', 'Skill', 'Stamina', 'Jump'):
+        record = store.current_record(db, f'{course_name} Course')
+        if record:
+            event1, event2, event3, bonus = [points for _, points in store.event_breakdown(db, record['submission_id'])]
+            course_records[course_name] = Record(
+                record['row_num'], record['player'], record['score'], event1, event2, event3, bonus,
+                record['date'], record['link'], record['photo']
+            )
+    return course_records
+
+class EventSummary:
+    """Stream consumer over the raw events CSV rows keeping one event's best scoring submission"""
+
+    def __init__(self, event_name, score_col, lower_is_better=False):
+        self.event_name = event_name
+        self.score_col = score_col
+        self.lower_is_better = lower_is_better
+        self.record = None
+
+    def push(self, item):
+        _, row = item
+        if len(row) < 13:
+            return
+        score = parse_number(row[self.score_col - 1])
+        if score is None:
+            return
+        best = self.record
+        if best is None or (score < best['score'] if self.lower_is_better else score > best['score']):
+            # Scores no formula can award points for are not records
+            points = scoring.points_column(self.event_name, [score])[0]
+            if points is not None:
+                self.record = {'player': row[0].strip(), 'score': score, 'points': points, 'date': parse_date(row[11])}
+
+def get_event_records(dataset=None, db=None):
+    """Get current world records for all events, from the SQLite store db if given"""
+    if dataset is None:
+        dataset = Dataset()
     event_configs = {
         'Hurdle Dash': {'score_col': 2, 'lower_is_better': True},
         'Pennant Capture': {'score_col': 3, 'lower_is_better': False},
@@ -512,86 +1674,106 @@ def get_event_records():
     
     # Fixed values for events without pages
     event_records = {
-        'Circle Push': {'player': '–', 'score': 66, 'points': 198, 'date': datetime.strptime('12/09/2009', '%d/%m/%Y').date()},
-        'Ring Drop': {'player': '–', 'score': 200, 'points': 200, 'date': datetime.strptime('12/09/2009', '%d/%m/%Y').date()}
+        'Circle Push': {'player': '–', 'score': 66, 'points': scoring.points('Circle Push', 66), 'date': datetime.strptime('12/09/2009', '%d/%m/%Y').date()},
+        'Ring Drop': {'player': '–', 'score': 200, 'points': scoring.points('Ring Drop', 200), 'date': datetime.strptime('12/09/2009', '%d/%m/%Y').date()}
     }
     
+    if db is not None:
+        for event_name in event_configs:
+            record = store.current_record(db, event_name)
+            if record:
+                event_records[event_name] = {'player': record['player'], 'score': record['score'], 'points': record['points'], 'date': record['date']}
+        return event_records
+
     events_csv = 'csv/Pokeathlon WRs - Events_best_scores.csv'
     if os.path.exists(events_csv):
         try:
-            with open(events_csv, newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                if len(rows) > 1:
-                    for event_name, config in event_configs.items():
-                        best_record = None
-                        best_score = None
-                        
-                        for row in rows[1:]:
-                            if len(row) >= 13:
-                                try:
-                                    score = parse_number(row[config['score_col'] - 1])
-                                    if score is not None:
-                                        # Calculate points using formulas
-                                        points_map = {
-                                            'Hurdle Dash': lambda s: min(200, int(11500 / s)),
-                                            'Pennant Capture': lambda s: min(200, int(s * 3)),
-                                            'Circle Push': lambda s: min(200, int(s * 3)),
-                                            'Block Smash': lambda s: min(200, int(s)),
-                                            'Disc Catch': lambda s: min(200, int(150 - (1500 / (s + 12.5)))),
-                                            'Lamp Jump': lambda s: min(200, int(s / 3.5)),
-                                            'Relay Run': lambda s: min(200, int(s * 10)),
-                                            'Ring Drop': lambda s: min(200, int(s * 1.5)),
-                                            'Snow Throw': lambda s: min(200, int(s * 3)),
-                                            'Goal Roll': lambda s: min(200, int(100 + 5 * s))
-                                        }
-                                        
-                                        points = points_map.get(event_name, lambda s: min(200, int(s)))(score)
-                                        
-                                        if best_score is None:
-                                            best_score = score
-                                            best_record = {'player': row[0].strip(), 'score': score, 'points': points, 'date': parse_date(row[11])}
-                                        elif config['lower_is_better']:
-                                            if score < best_score:
-                                                best_score = score
-                                                best_record = {'player': row[0].strip(), 'score': score, 'points': points, 'date': parse_date(row[11])}
-                                        else:
-                                            if score > best_score:
-                                                best_score = score
-                                                best_record = {'player': row[0].strip(), 'score': score, 'points': points, 'date': parse_date(row[11])}
-                                except (ValueError, IndexError):
-                                    continue
-                        
-                        if best_record:
-                            event_records[event_name] = best_record
+            # Every event's best hangs off the same pass over the events CSV
+            summaries = {event_name: EventSummary(event_name, config['score_col'], config['lower_is_better'])
+                         for event_name, config in event_configs.items()}
+            consume(dataset.stream(events_csv), [summary.push for summary in summaries.values()])
+            for event_name, summary in summaries.items():
+                if summary.record:
+                    event_records[event_name] = summary.record
         except Exception as e:
             print(f"Warning: Could not read {events_csv}: {e}")
     
     return event_records
 
-def generate_index_html():
-    """Generate the main index.html file"""
-    course_records = get_course_records()
-    event_records = get_event_records()
-    
-    event_formulas = {
-        'Hurdle Dash': r'\( \left\lfloor \frac{11500}{\text{score}} \right\rfloor \)',
-        'Pennant Capture': r'\( \text{score} \times 3 \)',
-        'Circle Push': r'\( \text{score} \times 3 \)',
-        'Block Smash': r'\( \text{score} \)',
-        'Disc Catch': r'\( 150 - \frac{1500}{\text{score} + 12.5} \)',
-        'Lamp Jump': r'\( \left\lfloor \frac{\text{score}}{3.5} \right\rfloor \)',
-        'Relay Run': r'\( \text{score} \times 10 \)',
-        'Ring Drop': r'\( \text{score} \times 1.5 \)',
-        'Snow Throw': r'\( \text{score} \times 3 \)',
-        'Goal Roll': r'\( \text{position_points} + \text{score} \times 5 \)'
-    }
+_INDEX_COURSE_ROW = '''
+        <tr>
+          <td><a href="courses/{slug}.html">{course_name}</a></td>
+          <td>{player}</td>
+          <td>{total_score}</td>
+          <td>{event1}</td>
+          <td>{event2}</td>
+          <td>{event3}</td>
+          <td>{bonus}</td>
+          <td>{date}</td>
+        </tr>'''.format
+
+_INDEX_EVENT_ROW = '''
+        <tr>
+          {event_cell}
+          <td>{player}</td>
+          <td>{score}</td>
+          <td>{points}</td>
+          <td>{formula}</td>
+          <td>{date}</td>
+        </tr>'''.format
+
+def check_course_points(dataset=None):
+    """Cross-check the event points in the course CSVs against the raw scores in the events CSV"""
+    if dataset is None:
+        dataset = Dataset()
+    issues = []
+    best_points = {}
+    if os.path.exists(EVENTS_CSV):
+        rows = dataset.rows(EVENTS_CSV)
+        header = dataset.header(EVENTS_CSV)
+        for event_name in scoring.EVENT_FORMULAS:
+            if event_name not in header:
+                continue
+            scores = dataset.column(EVENTS_CSV, header.index(event_name) + 1, parse_number)
+            for row, points in zip(rows, scoring.points_column(event_name, scores)):
+                key = (row[0].strip(), event_name)
+                if points is not None and points > best_points.get(key, -1):
+                    best_points[key] = points
+
+    for course_name, config in COURSES_CONFIG.items():
+        csv_file = config['csv_file']
+        if not os.path.exists(csv_file):
+            continue
+        rows = dataset.rows(csv_file)
+        for n in (1, 2, 3):
+            event_name = config[f'event{n}_name']
+            event_points = dataset.column(csv_file, config[f'event{n}_col'], parse_number)
+            for i, row in enumerate(rows):
+                points = event_points[i]
+                if points is None:
+                    continue
+                player = row[0].strip()
+                best = best_points.get((player, event_name))
+                if points > scoring.POINTS_CAP:
+                    issues.append(f"{course_name} row {i + 2}: {player} has {points:g} {event_name} points, above the {scoring.POINTS_CAP} cap")
+                elif best is not None and points > best:
+                    issues.append(f"{course_name} row {i + 2}: {player} has {points:g} {event_name} points, but their best recorded {event_name} score is worth {best}")
+    return issues
+
+def _event_points_display(points):
+    """Show a course's event points as an integer, or '--' when missing"""
+    points = int(points) if points else 0
+    return points if points > 0 else '--'
+
+def render_index_html(course_records, event_records):
+    """Yield the fragments of the main index page"""
+    event_formulas = {event_name: scoring.latex(event_name) for event_name in scoring.EVENT_FORMULAS}
     
-    html_content = '''<!DOCTYPE html>
+    yield f'''<!DOCTYPE html>
 <html>
 <head>
   <title>Pokeathlon World Records</title>
-  <link rel="stylesheet" href="style.css">
+  <link rel="stylesheet" href="{assets.url('style.css')}">
   <link rel="icon" href="championship-trophy.svg" type="image/svg+xml">
   <link rel="sitemap" type="application/xml" title="Sitemap" href="https://pokeathlonhub.github.io/sitemap.xml">
   <script src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js" defer></script>
@@ -628,6 +1810,11 @@ def generate_index_html():
     <ul id="calculatorsMenu">
       <li><a href="calculators/PID.html">PID</a></li>
     </ul>
+
+    <h3 id="playersToggle">Players</h3>
+    <ul id="playersMenu">
+      <li><a href="players/index.html">All Players</a></li>
+    </ul>
   </div>
 
   <h1>Pokeathlon World Records</h1>
@@ -653,31 +1840,24 @@ def generate_index_html():
     for course_name in ['Speed', 'Power', 'Skill', 'Stamina', 'Jump']:
         if course_name in course_records:
             record = course_records[course_name]
-            html_content += f'''
-        <tr>
-          <td><a href="courses/{course_name.lower()}.html">{course_name}</a></td>
-          <td>{record['player']}</td>
-          <td>{record['total_score']}</td>
-          <td>{record['event1_points']}</td>
-          <td>{record['event2_points']}</td>
-          <td>{record['event3_points']}</td>
-          <td>{record['bonus']}</td>
-          <td>{record['date'].strftime("%d/%m/%Y") if record['date'] else '--'}</td>
-        </tr>'''
+            yield _INDEX_COURSE_ROW(
+                slug=course_name.lower(),
+                course_name=course_name,
+                player=record.player,
+                total_score=int(record.total_score),
+                event1=_event_points_display(record.event1),
+                event2=_event_points_display(record.event2),
+                event3=_event_points_display(record.event3),
+                bonus=int(record.bonus_points) if record.bonus_points else '--',
+                date=record.date.strftime("%d/%m/%Y") if record.date else '--'
+            )
         else:
-            html_content += f'''
-        <tr>
-          <td><a href="courses/{course_name.lower()}.html">{course_name}</a></td>
-          <td>–</td>
-          <td>–</td>
-          <td>–</td>
-          <td>–</td>
-          <td>–</td>
-          <td>–</td>
-          <td>–</td>
-        </tr>'''
+            yield _INDEX_COURSE_ROW(
+                slug=course_name.lower(), course_name=course_name,
+                player='–', total_score='–', event1='–', event2='–', event3='–', bonus='–', date='–'
+            )
     
-    html_content += '''
+    yield '''
       </tbody>
     </table>
   </div>
@@ -710,124 +1890,722 @@ def generate_index_html():
             else:
                 event_cell = f'<td><a href="events/{event_name.lower().replace(' ', '-')}.html">{event_name}</a></td>'
             
-            html_content += f'''
-        <tr>
-          {event_cell}
-          <td>{record['player']}</td>
-          <td>{score_display}</td>
-          <td>{record['points']}</td>
-          <td>{event_formulas[event_name]}</td>
-          <td>{record['date'].strftime("%d/%m/%Y") if record['date'] else '--'}</td>
-        </tr>'''
+            yield _INDEX_EVENT_ROW(
+                event_cell=event_cell,
+                player=record['player'],
+                score=score_display,
+                points=record['points'],
+                formula=event_formulas[event_name],
+                date=record['date'].strftime("%d/%m/%Y") if record['date'] else '--'
+            )
         else:
-            html_content += f'''
-        <tr>
-          <td>{event_name}</td>
-          <td>–</td>
-          <td>–</td>
-          <td>–</td>
-          <td>{event_formulas.get(event_name, '–')}</td>
-          <td>–</td>
-        </tr>'''
+            yield _INDEX_EVENT_ROW(
+                event_cell=f'<td>{event_name}</td>',
+                player='–', score='–', points='–',
+                formula=event_formulas.get(event_name, '–'),
+                date='–'
+            )
     
-    html_content += '''
+    yield f'''
       </tbody>
     </table>
   </div>
 
   <p>Position points: 100-80-70-60.</p>
 
-  <script src="js/tablesort.min.js"></script>
-  <script src="js/tablesort.number.min.js"></script>
-  <script src="js/tablesort.date.js"></script>
-  <script src="js/theme-toggle.js"></script>
-  <script src="js/sidebar-menu.js" defer></script>
-  <script>
-    document.querySelectorAll('table').forEach(table => {
-      const sort = new Tablesort(table);
-    });
-  </script>
+  <script src="{assets.url('index.js')}"></script>
 </body>
 </html>'''
-    
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
-
-def generate_all():
-    """Generate all HTML files"""
-    # Course configurations
-    courses_config = {
-        'Speed Course': {
-            'csv_file': 'csv/Pokeathlon WRs - Speed_Course.csv',
-            'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/speed.html',
-            'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
-            'event1_name': 'Hurdle Dash', 'event2_name': 'Pennant Capture', 'event3_name': 'Relay Run'
-        },
-        'Jump Course': {
-            'csv_file': 'csv/Pokeathlon WRs - Jump_Course.csv',
-            'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/jump.html',
-            'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
-            'event1_name': 'Lamp Jump', 'event2_name': 'Disc Catch', 'event3_name': 'Hurdle Dash'
-        },
-        'Power Course': {
-            'csv_file': 'csv/Pokeathlon WRs - Power_Course.csv',
-            'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/power.html',
-            'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
-            'event1_name': 'Block Smash', 'event2_name': 'Circle Push', 'event3_name': 'Goal Roll'
-        },
-        'Skill Course': {
-            'csv_file': 'csv/Pokeathlon WRs - Skill_Course.csv',
-            'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/skill.html',
-            'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
-            'event1_name': 'Snow Throw', 'event2_name': 'Goal Roll', 'event3_name': 'Pennant Capture'
-        },
-        'Stamina Course': {
-            'csv_file': 'csv/Pokeathlon WRs - Stamina_Course.csv',
-            'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/stamina.html',
-            'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
-            'event1_name': 'Ring Drop', 'event2_name': 'Relay Run', 'event3_name': 'Block Smash'
-        }
+
+def generate_index_html(dataset=None, stats=None, db=None):
+    """Generate the main index.html file"""
+    start = time.perf_counter()
+    course_records = get_course_records(dataset, db)
+    event_records = get_event_records(dataset, db)
+    add_timing(stats, 'records', time.perf_counter() - start)
+    write_page('index.html', render_index_html(course_records, event_records), stats)
+
+EVENTS_CSV = 'csv/Pokeathlon WRs - Events_best_scores.csv'
+
+# Course configurations
+COURSES_CONFIG = {
+    'Speed Course': {
+        'csv_file': 'csv/Pokeathlon WRs - Speed_Course.csv',
+        'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/speed.html',
+        'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
+        'event1_name': 'Hurdle Dash', 'event2_name': 'Pennant Capture', 'event3_name': 'Relay Run'
+    },
+    'Jump Course': {
+        'csv_file': 'csv/Pokeathlon WRs - Jump_Course.csv',
+        'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/jump.html',
+        'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
+        'event1_name': 'Lamp Jump', 'event2_name': 'Disc Catch', 'event3_name': 'Hurdle Dash'
+    },
+    'Power Course': {
+        'csv_file': 'csv/Pokeathlon WRs - Power_Course.csv',
+        'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/power.html',
+        'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
+        'event1_name': 'Block Smash', 'event2_name': 'Circle Push', 'event3_name': 'Goal Roll'
+    },
+    'Skill Course': {
+        'csv_file': 'csv/Pokeathlon WRs - Skill_Course.csv',
+        'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/skill.html',
+        'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
+        'event1_name': 'Snow Throw', 'event2_name': 'Goal Roll', 'event3_name': 'Pennant Capture'
+    },
+    'Stamina Course': {
+        'csv_file': 'csv/Pokeathlon WRs - Stamina_Course.csv',
+        'score_col': 2, 'date_col': 7, 'link_col': 8, 'output_file': 'courses/stamina.html',
+        'event1_col': 3, 'event2_col': 4, 'event3_col': 5, 'bonus_col': 6,
+        'event1_name': 'Ring Drop', 'event2_name': 'Relay Run', 'event3_name': 'Block Smash'
     }
-    
-    # Event configurations
-    events_config = {
-        'Hurdle Dash': {'score_col': 2, 'date_col': 12, 'link_col': 13, 'output_file': 'events/hurdle-dash.html', 'lower_is_better': True},
-        'Pennant Capture': {'score_col': 3, 'date_col': 12, 'link_col': 13, 'output_file': 'events/pennant-capture.html'},
-        'Block Smash': {'score_col': 5, 'date_col': 12, 'link_col': 13, 'output_file': 'events/block-smash.html'},
-        'Disc Catch': {'score_col': 6, 'date_col': 12, 'link_col': 13, 'output_file': 'events/disc-catch.html'},
-        'Lamp Jump': {'score_col': 7, 'date_col': 12, 'link_col': 13, 'output_file': 'events/lamp-jump.html'},
-        'Relay Run': {'score_col': 8, 'date_col': 12, 'link_col': 13, 'output_file': 'events/relay-run.html'},
-        'Snow Throw': {'score_col': 10, 'date_col': 12, 'link_col': 13, 'output_file': 'events/snow-throw.html'},
-        'Goal Roll': {'score_col': 11, 'date_col': 12, 'link_col': 13, 'output_file': 'events/goal-roll.html'}
+}
+
+# Event configurations (any entry may also set 'top_k' to track a larger board than the top 3)
+EVENTS_CONFIG = {
+    'Hurdle Dash': {'score_col': 2, 'date_col': 12, 'link_col': 13, 'output_file': 'events/hurdle-dash.html', 'lower_is_better': True},
+    'Pennant Capture': {'score_col': 3, 'date_col': 12, 'link_col': 13, 'output_file': 'events/pennant-capture.html'},
+    'Block Smash': {'score_col': 5, 'date_col': 12, 'link_col': 13, 'output_file': 'events/block-smash.html'},
+    'Disc Catch': {'score_col': 6, 'date_col': 12, 'link_col': 13, 'output_file': 'events/disc-catch.html'},
+    'Lamp Jump': {'score_col': 7, 'date_col': 12, 'link_col': 13, 'output_file': 'events/lamp-jump.html'},
+    'Relay Run': {'score_col': 8, 'date_col': 12, 'link_col': 13, 'output_file': 'events/relay-run.html'},
+    'Snow Throw': {'score_col': 10, 'date_col': 12, 'link_col': 13, 'output_file': 'events/snow-throw.html'},
+    'Goal Roll': {'score_col': 11, 'date_col': 12, 'link_col': 13, 'output_file': 'events/goal-roll.html'}
+}
+
+class SubmissionSpool:
+    """Player submissions spilled to disk in sorted runs and merged back one player at a time
+
+    Only run_size submissions are held in memory, however large the CSVs are.
+    """
+
+    def __init__(self, run_size=65536):
+        self.run_size = run_size
+        self._buffer = []
+        self._runs = []
+
+    def push(self, position, record):
+        """Spool a submission to the leaderboard at position (in site order)"""
+        self._buffer.append((record.player, record.date.toordinal(), position, record.row_num,
+                             record.total_score, record.link, record.photo))
+        if len(self._buffer) >= self.run_size:
+            self._spill()
+
+    def _spill(self):
+        self._buffer.sort()
+        run = tempfile.TemporaryFile('w+', encoding='utf-8')
+        run.writelines(json.dumps(entry) + '\n' for entry in self._buffer)
+        run.seek(0)
+        self._runs.append(run)
+        self._buffer = []
+
+    def players(self):
+        """Yield (player, submissions) in name order, submissions being (position, Record) by date, leaderboard and row"""
+        self._buffer.sort()
+        runs = [(tuple(json.loads(line)) for line in run) for run in self._runs]
+        for player, entries in itertools.groupby(heapq.merge(*runs, self._buffer), key=lambda entry: entry[0]):
+            yield player, ((position, Record(row_num, player, score, date=date.fromordinal(ordinal), link=link, photo=photo))
+                           for _, ordinal, position, row_num, score, link, photo in entries)
+
+    def close(self):
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._buffer = []
+
+class PlayerIndex:
+    """Inverted index from each player to their personal bests, submission counts and tenures on every leaderboard
+
+    The submissions themselves go to a SubmissionSpool as they stream past.
+    """
+
+    def __init__(self):
+        self.leaderboards = {}
+        self.players = {}
+        self.spool = SubmissionSpool()
+
+    def add(self, leaderboard, page, lower_is_better=False, top_k=3):
+        """Register a leaderboard, returning the consumer its submissions are fed to in file order"""
+        position = len(self.leaderboards)
+        self.leaderboards[leaderboard] = {'page': page, 'lower_is_better': lower_is_better, 'top_k': top_k}
+
+        def push(record):
+            if not record.player:
+                return
+            boards = self.players.setdefault(record.player, {})
+            entry = boards.get(leaderboard)
+            if entry is None:
+                entry = boards[leaderboard] = {'submissions': 0}
+            entry['submissions'] += 1
+            self.spool.push(position, record)
+        return push
+
+    def finish(self, leaderboard, bests, first_holder_days, top23_presence_days):
+        """Complete a leaderboard once replayed, from its PersonalBests and tenure days"""
+        for player, best in bests.best.items():
+            self.players[player][leaderboard].update(
+                best=best, first_days=first_holder_days.get(player, 0), top_days=top23_presence_days.get(player, 0)
+            )
+
+# File names taken by the players directory itself
+_RESERVED_PLAYER_SLUGS = {'index'}
+
+def player_slugs(names):
+    """Map player names to file names; names that clash once lowercased, or with a reserved name, get a hash suffix"""
+    groups = {}
+    for name in names:
+        slug = re.sub(r'\W+', '-', name.lower()).strip('-') or 'player'
+        groups.setdefault(slug, []).append(name)
+    slugs = {}
+    for slug, group in groups.items():
+        for name in group:
+            unique = len(group) == 1 and slug not in _RESERVED_PLAYER_SLUGS
+            slugs[name] = slug if unique else f"{slug}-{hashlib.sha256(name.encode('utf-8')).hexdigest()[:8]}"
+    return slugs
+
+_PLAYER_BEST_ROW = '''
+                <tr data-proof="{proof_type}">
+                    <td><a href="../{page}">{leaderboard}</a></td>
+                    <td>{score}</td>
+                    <td>{date}</td>
+                    <td>{proof}</td>
+                    <td>{first_days}</td>
+                    <td>{top_days}</td>
+                </tr>'''.format
+
+_PLAYER_SUBMISSION_ROW = '''
+                <tr data-proof="{proof_type}">
+                    <td>{date}</td>
+                    <td><a href="../{page}">{leaderboard}</a></td>
+                    <td>{score}</td>
+                    <td>{proof}</td>
+                </tr>'''.format
+
+_PLAYERS_INDEX_ROW = '''
+                <tr>
+                    <td><a href="{href}">{name}</a></td>
+                    <td>{leaderboards}</td>
+                    <td>{submissions}</td>
+                    <td>{first_days}</td>
+                </tr>'''.format
+
+def _player_proof(record, leaderboard_info):
+    proof_type = get_proof_type(record.photo, record.link)
+    # Event pages call unverified links "Link", course pages "Claimed Only"
+    is_event = leaderboard_info['page'].startswith('events/')
+    return proof_type, format_proof_link(record.link, proof_type, is_event)
+
+def render_player_html(name, boards, leaderboards, submissions):
+    """Yield the fragments of a player's profile page, submissions being (position, Record) in display order"""
+    top_ks = set(info['top_k'] for info in leaderboards.values())
+    top_k = top_ks.pop() if len(top_ks) == 1 else 'K'
+    yield f'''<!DOCTYPE html>
+<html>
+<head>
+    <title>{name} - Pokéathlon WRs</title>
+    <link rel="stylesheet" href="{assets.url('style.css', '../')}">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="icon" href="../championship-trophy.svg" type="image/svg+xml">
+</head>
+<body>
+    <button id="themeToggle" class="theme-toggle" aria-label="Toggle dark/light theme">🌙</button>
+    <nav><a href="../index.html">← Back to All Events</a> · <a href="index.html">All Players</a></nav>
+
+    <h1>{name}</h1>
+
+    <h2>Personal Bests</h2>
+    <div class="table-wrapper">
+        <table>
+            <thead>
+                <tr>
+                    <th>Leaderboard</th>
+                    <th data-sort-method='number'>Best</th>
+                    <th>Date</th>
+                    <th>Proof</th>
+                    <th data-sort-method='number'>Days at #1</th>
+                    <th data-sort-method='number'>Days in Top {top_k} (positions 2-{top_k})</th>
+                </tr>
+            </thead>
+            <tbody>'''
+
+    # Leaderboards in site order: events first, then courses
+    for leaderboard, info in leaderboards.items():
+        entry = boards.get(leaderboard)
+        if entry is None:
+            continue
+        best = entry['best']
+        proof_type, proof = _player_proof(best, info)
+        yield _PLAYER_BEST_ROW(
+            proof_type=proof_type, page=info['page'], leaderboard=leaderboard, score=_score_text(best.total_score),
+            date=best.date.strftime("%d/%m/%Y"), proof=proof, first_days=entry['first_days'], top_days=entry['top_days']
+        )
+
+    yield '''
+            </tbody>
+        </table>
+    </div>
+
+    <h2>Submissions</h2>
+    <div class="table-wrapper">
+        <table>
+            <thead>
+                <tr>
+                    <th>Date</th>
+                    <th>Leaderboard</th>
+                    <th data-sort-method='number'>Score</th>
+                    <th>Proof</th>
+                </tr>
+            </thead>
+            <tbody>'''
+
+    names = list(leaderboards)
+    for position, record in submissions:
+        leaderboard = names[position]
+        info = leaderboards[leaderboard]
+        proof_type, proof = _player_proof(record, info)
+        yield _PLAYER_SUBMISSION_ROW(
+            proof_type=proof_type, date=record.date.strftime("%d/%m/%Y"), page=info['page'],
+            leaderboard=leaderboard, score=_score_text(record.total_score), proof=proof
+        )
+
+    yield f'''
+            </tbody>
+        </table>
+    </div>
+    <script src="{assets.url('page.js', '../')}"></script>
+</body>
+</html>'''
+
+def render_players_index_html(player_index, slugs):
+    """Yield the fragments of the player directory, most days at #1 first"""
+    yield f'''<!DOCTYPE html>
+<html>
+<head>
+    <title>Players - Pokéathlon WRs</title>
+    <link rel="stylesheet" href="{assets.url('style.css', '../')}">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="icon" href="../championship-trophy.svg" type="image/svg+xml">
+</head>
+<body>
+    <button id="themeToggle" class="theme-toggle" aria-label="Toggle dark/light theme">🌙</button>
+    <nav><a href="../index.html">← Back to All Events</a></nav>
+
+    <h1>Players</h1>
+
+    <div class="table-wrapper">
+        <table>
+            <thead>
+                <tr>
+                    <th>Player</th>
+                    <th data-sort-method='number'>Leaderboards</th>
+                    <th data-sort-method='number'>Submissions</th>
+                    <th data-sort-method='number'>Days at #1</th>
+                </tr>
+            </thead>
+            <tbody>'''
+
+    first_days = {name: sum(entry['first_days'] for entry in boards.values()) for name, boards in player_index.players.items()}
+    for name in sorted(player_index.players, key=lambda n: (-first_days[n], n.lower(), n)):
+        boards = player_index.players[name]
+        yield _PLAYERS_INDEX_ROW(
+            href=quote(f'{slugs[name]}.html'), name=name, leaderboards=len(boards),
+            submissions=sum(entry['submissions'] for entry in boards.values()), first_days=first_days[name]
+        )
+
+    yield f'''
+            </tbody>
+        </table>
+    </div>
+    <script src="{assets.url('page.js', '../')}"></script>
+</body>
+</html>'''
+
+def build_player_index(dataset, engine='python'):
+    """Analyze every leaderboard once and index the results by player"""
+    player_index = PlayerIndex()
+    for name, html_style, config in page_jobs():
+        csv_file = EVENTS_CSV if html_style == "simple" else config['csv_file']
+        breakdown = [config.get(key) for key in ('event1_col', 'event2_col', 'event3_col', 'bonus_col')]
+        lower_is_better = config.get('lower_is_better', False)
+        top_k = config.get('top_k', 3)
+        personal_bests = {}
+        _, _, first_holder_days, top23_presence_days, _ = analyze_leaderboard(
+            csv_file, config['score_col'], config['date_col'], config['link_col'], lower_is_better, *breakdown,
+            dataset=dataset, top_k=top_k, engine=engine, keep_records=False, personal_bests=personal_bests,
+            record_consumers=[player_index.add(name, config['output_file'], lower_is_better, top_k)]
+        )
+        player_index.finish(name, personal_bests[ALL_TIER], first_holder_days, top23_presence_days)
+    return player_index
+
+def generate_player_pages(dataset=None, engine='python', stats=None):
+    """Generate a profile page per player and the player directory, removing pages of players who left the CSVs"""
+    if dataset is None:
+        dataset = Dataset()
+    start = time.perf_counter()
+    player_index = build_player_index(dataset, engine)
+    slugs = player_slugs(player_index.players)
+    add_timing(stats, 'players', time.perf_counter() - start)
+
+    os.makedirs(PLAYERS_DIR, exist_ok=True)
+    pages = set()
+    try:
+        for name, submissions in player_index.spool.players():
+            output_file = os.path.join(PLAYERS_DIR, f'{slugs[name]}.html')
+            pages.add(output_file)
+            write_page(output_file, render_player_html(name, player_index.players[name], player_index.leaderboards, submissions), stats)
+    finally:
+        player_index.spool.close()
+    write_page(PLAYERS_INDEX, render_players_index_html(player_index, slugs), stats)
+    remove_stale_pages(os.path.join(PLAYERS_DIR, '*.html'), pages | {PLAYERS_INDEX})
+    if stats is not None:
+        stats['players'] = len(player_index.players)
+
+def store_sources():
+    """Describe the CSV files for store.ingest"""
+    sources = [{
+        'csv_file': EVENTS_CSV, 'date_col': 12, 'link_col': 13, 'country_col': 14,
+        'leaderboards': {name: (config['score_col'], config.get('lower_is_better', False), True) for name, config in EVENTS_CONFIG.items()}
+    }]
+    for course_name, config in COURSES_CONFIG.items():
+        sources.append({
+            'csv_file': config['csv_file'], 'date_col': config['date_col'], 'link_col': config['link_col'], 'country_col': 9, 'photo_col': 10,
+            'leaderboards': {course_name: (config['score_col'], False, False)},
+            'event_points': [(config['event1_name'], config['event1_col']), (config['event2_name'], config['event2_col']),
+                             (config['event3_name'], config['event3_col']), ('Bonus points', config['bonus_col'])]
+        })
+    return [source for source in sources if os.path.exists(source['csv_file'])]
+
+MANIFEST_FILE = 'build-manifest.json'
+
+PLAYERS_DIR = 'players'
+PLAYERS_INDEX = os.path.join(PLAYERS_DIR, 'index.html')
+
+def file_digest(path):
+    """Return the SHA-256 of a file's contents, or None if it does not exist"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        _hash_file(f, digest)
+    return digest.hexdigest()
+
+# Modules whose code shapes the generated pages
+GENERATOR_SOURCES = ['generate.py', 'parsing.py', 'scoring.py', 'columnar.py', 'store.py', 'assets.py', 'pid_solver.py']
+
+def generator_version():
+    """Fingerprint of the generator source, so template changes rebuild every page"""
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    digests = [file_digest(os.path.join(source_dir, source)) for source in GENERATOR_SOURCES]
+    return hashlib.sha256(json.dumps(digests).encode('utf-8')).hexdigest()
+
+def load_manifest():
+    """Load the input-hash manifest of the previous build"""
+    try:
+        with open(MANIFEST_FILE, encoding='utf-8') as f:
+            return json.load(f).get('pages', {})
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(pages):
+    """Persist the input-hash manifest for the next build"""
+    write_page(MANIFEST_FILE, [json.dumps({'pages': pages}, indent=2, sort_keys=True), '\n'], compress=False)
+
+def page_dependencies():
+    """Map each output page to the CSV files and config entries it is built from"""
+    dependencies = {}
+    for event_name, config in EVENTS_CONFIG.items():
+        dependencies[config['output_file']] = ([EVENTS_CSV], {event_name: config})
+    for course_name, config in COURSES_CONFIG.items():
+        dependencies[config['output_file']] = ([config['csv_file']], {course_name: config})
+    all_csv_files = [EVENTS_CSV] + [config['csv_file'] for config in COURSES_CONFIG.values()]
+    dependencies['index.html'] = (all_csv_files, {'courses': COURSES_CONFIG, 'events': EVENTS_CONFIG})
+    # Profiles span every leaderboard; the directory page stands for all of them
+    dependencies[PLAYERS_INDEX] = (all_csv_files, {'courses': COURSES_CONFIG, 'events': EVENTS_CONFIG})
+    return dependencies
+
+def input_digest(csv_files, config, csv_digests, version, options=None):
+    """Combine the hashes of a page's inputs into a single digest"""
+    inputs = {
+        'csv': {csv_file: csv_digests[csv_file] for csv_file in csv_files},
+        'config': config,
+        'generator': version,
+        'options': options or {}
     }
-    
-    # Generate events
-    events_csv = 'csv/Pokeathlon WRs - Events_best_scores.csv'
-    if os.path.exists(events_csv):
-        for event_name, config in events_config.items():
-            try:
-                generate_leaderboard_html(
-                    events_csv, config['score_col'], config['date_col'], config['link_col'],
-                    event_name, config['output_file'], "simple", config.get('lower_is_better', False)
-                )
-            except Exception as e:
-                print(f"Error processing {event_name}: {e}")
-    
-    # Generate courses
-    for course_name, config in courses_config.items():
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+def page_jobs():
+    """List the event and course pages to build, in output order"""
+    jobs = []
+    if os.path.exists(EVENTS_CSV):
+        for event_name, config in EVENTS_CONFIG.items():
+            jobs.append((event_name, "simple", config))
+    for course_name, config in COURSES_CONFIG.items():
         if os.path.exists(config['csv_file']):
-            try:
-                generate_leaderboard_html(
-                    config['csv_file'], config['score_col'], config['date_col'], config['link_col'],
-                    course_name, config['output_file'], "advanced", False,
-                    config['event1_col'], config['event2_col'], config['event3_col'], config['bonus_col'],
-                    config['event1_name'], config['event2_name'], config['event3_name']
-                )
-            except Exception as e:
-                print(f"Error processing {course_name}: {e}")
+            jobs.append((course_name, "advanced", config))
+    return jobs
+
+def build_page(job, dataset, engine='python', page_size=0, client_render=False):
+    """Build one event or course page, returning (error message or None, page stats) instead of raising"""
+    name, html_style, config = job
+    stats = {'name': name, 'status': 'built'}
+    try:
+        if html_style == "simple":
+            generate_leaderboard_html(
+                EVENTS_CSV, config['score_col'], config['date_col'], config['link_col'],
+                name, config['output_file'], "simple", config.get('lower_is_better', False),
+                dataset=dataset, top_k=config.get('top_k', 3), engine=engine, stats=stats, page_size=page_size, client_render=client_render
+            )
+        else:
+            generate_leaderboard_html(
+                config['csv_file'], config['score_col'], config['date_col'], config['link_col'],
+                name, config['output_file'], "advanced", False,
+                config['event1_col'], config['event2_col'], config['event3_col'], config['bonus_col'],
+                config['event1_name'], config['event2_name'], config['event3_name'],
+                dataset=dataset, top_k=config.get('top_k', 3), engine=engine, stats=stats, page_size=page_size, client_render=client_render
+            )
+    except Exception as e:
+        stats.update(status='error', error=str(e))
+        return f"Error processing {name}: {e}", stats
+    return None, stats
+
+_worker_dataset = None
+_worker_engine = 'python'
+_worker_options = {}
+
+def _init_worker(engine, options, output, cache=True, checkpoints=None):
+    """Give each worker process its own load-once dataset and the parent's output settings"""
+    global _worker_dataset, _worker_engine, _worker_options
+    _worker_dataset = Dataset(cache, checkpoints)
+    _worker_engine = engine
+    _worker_options = options
+    OUTPUT.update(output)
+
+def _build_page_in_worker(job):
+    return build_page(job, _worker_dataset, _worker_engine, **_worker_options)
+
+def generate_all(force=False, workers=1, engine='python', report=None, page_size=0, client_render=False, dataset=None, db=None, precompress=False, stream=False, checkpoints=True):
+    """Generate all HTML files whose inputs changed since the last build
+
+    If report is a dict, it is filled with per-page counters and stage timings.
+    A page_size splits long history and statistics tables into shards loaded on demand;
+    client_render writes slim pages that render their tables from the JSON data files.
+    A dataset can be passed in to reuse CSVs parsed by a previous build. With db, the
+    CSVs are first imported into that SQLite store and the index reads its records from it.
+    Only pages whose contents changed are written; precompress adds .gz siblings.
+    The JS and CSS bundles are rebuilt first and pages reference them by content hash.
+    With stream, CSVs are not kept in memory but streamed from disk by every page using them.
+    With checkpoints, pages resume their analysis from the previous build's state in CHECKPOINT_DIR.
+    """
+    build_start = time.perf_counter()
+    # Every CSV is read and parsed once, then shared by all pages
+    if dataset is None:
+        dataset = Dataset(cache=not stream, checkpoints=Checkpoints() if checkpoints else None)
+
+    # Output options change the pages, so they are part of every page digest
+    options = {'page_size': page_size, 'client_render': client_render}
+    OUTPUT['gzip'] = precompress
+    assets.reset()
+    asset_stats = {}
+    write_assets(asset_stats)
+    generate_pid_index(asset_stats)
+    # A new bundle name changes every page referencing it
+    asset_names = {name: assets.bundle(name)[0] for name in assets.BUNDLES}
+    previous_pages = {} if force else load_manifest()
+    version = generator_version()
+    csv_digests = {}
+    page_digests = {}
+    for output_file, (csv_files, config) in page_dependencies().items():
+        for csv_file in csv_files:
+            if csv_file not in csv_digests:
+                csv_digests[csv_file] = file_digest(csv_file)
+        page_digests[output_file] = input_digest(csv_files, config, csv_digests, version, dict(options, gzip=precompress, assets=asset_names))
+    built_pages = {page: digest for page, digest in previous_pages.items() if page in page_digests}
+
+    def is_stale(output_file):
+        return previous_pages.get(output_file) != page_digests[output_file] or not os.path.exists(output_file)
+
+    jobs = [job for job in page_jobs() if is_stale(job[2]['output_file'])]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(engine, options, OUTPUT, dataset.cache, dataset.checkpoints)) as executor:
+            # map() yields results in submission order, so the report matches a serial build
+            results = list(executor.map(_build_page_in_worker, jobs))
+    else:
+        results = [build_page(job, dataset, engine, **options) for job in jobs]
+
+    page_stats = {job[2]['output_file']: {'name': job[0], 'status': 'skipped'} for job in page_jobs()}
+    for job, (error, stats) in zip(jobs, results):
+        page_stats[job[2]['output_file']] = stats
+        if error:
+            print(error)
+            continue
+        if stats.get('parse_errors'):
+            first = stats['parse_errors'][0]
+            print(f"Warning: {job[0]}: {len(stats['parse_errors'])} cells could not be parsed, "
+                  f"first at row {first['row']}, column {first['column']} ({first['text']!r}: {first['reason']})")
+        # A page with bad cells is still built; it only needs rebuilding once its inputs change
+        built_pages[job[2]['output_file']] = page_digests[job[2]['output_file']]
     
+    page_stats[PLAYERS_INDEX] = {'name': 'Players', 'status': 'skipped'}
+    if is_stale(PLAYERS_INDEX):
+        page_stats[PLAYERS_INDEX]['status'] = 'built'
+        generate_player_pages(dataset, engine, page_stats[PLAYERS_INDEX])
+        built_pages[PLAYERS_INDEX] = page_digests[PLAYERS_INDEX]
+
     # Generate index.html
-    generate_index_html()
+    page_stats['index.html'] = {'name': 'Index', 'status': 'skipped'}
+    if is_stale('index.html'):
+        page_stats['index.html']['status'] = 'built'
+        conn = None
+        if db:
+            conn = store.connect(db)
+            store.ingest(conn, store_sources())
+        generate_index_html(dataset, page_stats['index.html'], conn)
+        if conn is not None:
+            conn.close()
+        built_pages['index.html'] = page_digests['index.html']
+
+    save_manifest(built_pages)
+
+    if report is not None:
+        report.update(
+            generator_version=version,
+            engine=engine,
+            workers=workers,
+            options=options,
+            assets=asset_stats,
+            total_seconds=time.perf_counter() - build_start,
+            pages=page_stats
+        )
+
+WATCH_DIR = 'csv'
+
+def watched_files():
+    """The CSV files, generator sources and asset sources --watch polls"""
+    return sorted(set(glob.glob(os.path.join(WATCH_DIR, '*.csv'))) | set(GENERATOR_SOURCES) | set(assets.sources()))
+
+def poll_changes(state):
+    """Return the watched files whose contents changed since the last poll
+
+    state maps each file to its (mtime, SHA-256); a file is only hashed again
+    when its mtime moved, so touching a file without editing it is ignored.
+    """
+    changed = []
+    for path in sorted(set(watched_files()) | set(state)):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        previous = state.get(path)
+        if previous and previous[0] == mtime:
+            continue
+        digest = file_digest(path)
+        state[path] = (mtime, digest)
+        if previous is None or previous[1] != digest:
+            changed.append(path)
+    return changed
+
+def watch(interval=1.0, workers=1, engine='python', page_size=0, client_render=False, precompress=False, checkpoints=True):
+    """Rebuild the pages backed by a CSV whenever it changes, keeping the parsed CSVs in memory
+
+    A change to the generator itself restarts the process so the new code is used.
+    """
+    dataset = Dataset(checkpoints=Checkpoints() if checkpoints else None)
+    state = {}
+    poll_changes(state)
+    generate_all(workers=workers, engine=engine, page_size=page_size, client_render=client_render, dataset=dataset,
+                 precompress=precompress)
+    print(f"Watching {WATCH_DIR}/ and the generator sources, press Ctrl+C to stop")
+    while True:
+        time.sleep(interval)
+        changed = poll_changes(state)
+        if not changed:
+            continue
+        if any(path in GENERATOR_SOURCES for path in changed):
+            print(f"{', '.join(changed)} changed, restarting")
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        start = time.perf_counter()
+        for path in changed:
+            dataset.invalidate(path)
+        # The manifest digests limit the rebuild to the pages backed by the changed files
+        report = {}
+        generate_all(workers=workers, engine=engine, report=report, page_size=page_size, client_render=client_render, dataset=dataset,
+                 precompress=precompress)
+        built = [stats['name'] for stats in report['pages'].values() if stats['status'] == 'built']
+        print(f"{', '.join(changed)} changed, rebuilt {', '.join(built) or 'nothing'} in {time.perf_counter() - start:.2f}s")
 
 if __name__ == "__main__":
-    generate_all()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the Pokeathlon WR site from the CSV files")
+    parser.add_argument('--force', action='store_true', help="rebuild every page, ignoring the build manifest")
+    parser.add_argument('--jobs', type=int, default=1, metavar='N', help="build pages in N worker processes")
+    parser.add_argument('--engine', choices=['python', 'numpy'], default='python', help="leaderboard replay engine (numpy needs NumPy installed)")
+    parser.add_argument('--page-size', type=int, default=0, metavar='N',
+                        help="show N rows of record history and statistics per page, loading older rows from shards on demand")
+    parser.add_argument('--client-render', action='store_true',
+                        help="write slim pages that render their tables from the per-leaderboard JSON data files")
+    parser.add_argument('--db', metavar='FILE', help="import the CSVs into this SQLite store and read the index records from it")
+    parser.add_argument('--ingest', metavar='FILE', help="only import the CSVs into this SQLite store, then exit")
+    parser.add_argument('--standings', metavar='LEADERBOARD', help="print the top K of a leaderboard as of --as-of, then exit")
+    parser.add_argument('--as-of', metavar='DATE', help="date for --standings, DD/MM/YYYY (default: today)")
+    parser.add_argument('--watch', action='store_true', help="keep running and rebuild the pages of every CSV that changes")
+    parser.add_argument('--interval', type=float, default=1.0, metavar='SECONDS', help="how often --watch polls for changes (default: 1)")
+    parser.add_argument('--stream', action='store_true',
+                        help="stream the CSVs from disk for every page instead of keeping them in memory, for very large archives")
+    parser.add_argument('--gzip', action='store_true', help="also write precompressed .gz siblings of every page")
+    parser.add_argument('--no-checkpoints', action='store_true',
+                        help=f"replay every CSV from its first row instead of resuming from the state saved in {CHECKPOINT_DIR}/")
+    parser.add_argument('--check-points', action='store_true', help="cross-check course event points against the events CSV")
+    parser.add_argument('--stats-json', metavar='FILE', help="write per-page counters and stage timings as JSON")
+    parser.add_argument('--profile', nargs='?', const='generate.prof', metavar='FILE',
+                        help="run the build under cProfile and dump the stats (default: generate.prof); worker processes are not profiled")
+    args = parser.parse_args()
+    if args.engine == 'numpy' and columnar is None:
+        parser.error("--engine numpy requires NumPy")
+
+    if args.ingest:
+        conn = store.connect(args.ingest)
+        for csv_file, rows in store.ingest(conn, store_sources()).items():
+            print(f"{csv_file}: {rows} new rows")
+        conn.close()
+        sys.exit(0)
+
+    if args.standings:
+        as_of = parse_date(args.as_of) if args.as_of else datetime.now().date()
+        if as_of is None:
+            parser.error(f"--as-of must be a DD/MM/YYYY date, got {args.as_of!r}")
+        try:
+            standings = load_standings(args.standings, engine=args.engine)
+        except KeyError as e:
+            parser.error(e.args[0])
+        print(f"{leaderboard_config(args.standings)[0]} as of {as_of.strftime('%d/%m/%Y')}:")
+        for position, (_, player, score, day) in enumerate(standings.as_of(as_of), 1):
+            print(f"{position:>3}. {player} - {_score_text(score)} ({day.strftime('%d/%m/%Y')})")
+        sys.exit(0)
+
+    if args.watch:
+        try:
+            watch(args.interval, args.jobs, args.engine, args.page_size, args.client_render, args.gzip, not args.no_checkpoints)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    report = {} if args.stats_json else None
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    generate_all(force=args.force, workers=args.jobs, engine=args.engine, report=report,
+                 page_size=args.page_size, client_render=args.client_render, db=args.db,
+                 precompress=args.gzip, stream=args.stream, checkpoints=not args.no_checkpoints)
+    if profiler:
+        import pstats
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    if report is not None:
+        with open(args.stats_json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+    if args.check_points:
+        for issue in check_course_points():
+            print(f"Warning: {issue}")
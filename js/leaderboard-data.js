@@ -0,0 +1,179 @@
+// Renders the tables of a slim page (generate.py --client-render) from its JSON data file
+(function () {
+  const dataUrl = document.currentScript.dataset.src;
+
+  function cell(row, content) {
+    const td = document.createElement('td');
+    if (content instanceof Node) {
+      td.appendChild(content);
+    } else {
+      td.textContent = content;
+    }
+    row.appendChild(td);
+  }
+
+  function proofLink(link, proofType, isEvent) {
+    const a = document.createElement('a');
+    a.href = link;
+    if (proofType === 'video') {
+      a.textContent = 'Video';
+    } else if (proofType === 'photo') {
+      a.textContent = 'Photo';
+    } else {
+      a.textContent = isEvent ? 'Link' : 'Claimed Only';
+    }
+    return a;
+  }
+
+  // 2010-04-20 -> 20/04/2010
+  function displayDate(isoDate) {
+    return isoDate.split('-').reverse().join('/');
+  }
+
+  function points(value) {
+    return value ? Math.trunc(value) : '--';
+  }
+
+  function historyRow(data, i, isCurrent) {
+    const history = data.rows;
+    const proofType = data.proof_types[history.proof[i]];
+    const player = data.players[history.player[i]];
+    const row = document.createElement('tr');
+    if (data.style === 'advanced') {
+      row.dataset.proof = proofType;
+      cell(row, player);
+      cell(row, Math.trunc(history.score[i]));
+      cell(row, points(history.event1[i]));
+      cell(row, points(history.event2[i]));
+      cell(row, points(history.event3[i]));
+      cell(row, points(history.bonus[i]));
+      cell(row, displayDate(history.date[i]));
+      cell(row, proofLink(history.link[i], proofType, false));
+    } else if (isCurrent) {
+      cell(row, history.score[i]);
+      cell(row, player);
+      cell(row, history.date[i]);
+      cell(row, proofLink(history.link[i], proofType, true));
+    } else {
+      cell(row, player);
+      cell(row, history.score[i]);
+      cell(row, displayDate(history.date[i]));
+      cell(row, proofLink(history.link[i], proofType, true));
+    }
+    return row;
+  }
+
+  // Same marks as rank_change() in generate.py
+  function rankChange(rank, previous) {
+    if (previous === null) {
+      return 'NEW';
+    }
+    const moved = previous - rank;
+    return moved > 0 ? `▲${moved}` : moved < 0 ? `▼${-moved}` : '–';
+  }
+
+  function rankingRow(data, ranking, j) {
+    const rows = data.rows;
+    const i = ranking.row[j];
+    const row = document.createElement('tr');
+    cell(row, ranking.rank[j]);
+    cell(row, data.players[rows.player[i]]);
+    cell(row, data.style === 'advanced' ? Math.trunc(rows.score[i]) : rows.score[i]);
+    cell(row, displayDate(rows.date[i]));
+    cell(row, proofLink(rows.link[i], data.proof_types[rows.proof[i]], data.style !== 'advanced'));
+    cell(row, rankChange(ranking.rank[j], ranking.previous[j]));
+    cell(row, ranking.percentile[j]);
+    return row;
+  }
+
+  // Course pages hold precomputed tables for every proof filter
+  function selectedTier(data) {
+    const checked = document.querySelector('input[name="proofFilter"]:checked');
+    return checked && data.tiers[checked.value] ? checked.value : 'all-record';
+  }
+
+  function renderTier(data) {
+    const tier = data.tiers[selectedTier(data)];
+
+    const current = document.getElementById('current-record');
+    current.replaceChildren();
+    if (tier.current !== null) {
+      current.appendChild(historyRow(data, tier.current, true));
+    }
+
+    const ranking = document.getElementById('leaderboard-ranking');
+    const rankingRows = document.createDocumentFragment();
+    if (tier.ranking) {
+      tier.ranking.row.forEach((_, j) => rankingRows.appendChild(rankingRow(data, tier.ranking, j)));
+    }
+    ranking.replaceChildren(rankingRows);
+
+    const history = document.getElementById('record-history');
+    const fragment = document.createDocumentFragment();
+    tier.history.forEach(i => fragment.appendChild(historyRow(data, i, false)));
+    history.replaceChildren(fragment);
+
+    const stats = document.getElementById('leaderboard-stats');
+    stats.replaceChildren();
+    tier.stats.player.forEach((player, i) => {
+      const row = document.createElement('tr');
+      cell(row, data.players[player]);
+      cell(row, tier.stats.first_days[i]);
+      cell(row, tier.stats.top_days[i]);
+      stats.appendChild(row);
+    });
+
+    // Lets the proof filter pick up the new rows
+    document.dispatchEvent(new CustomEvent('rowsadded'));
+  }
+
+  // The board at the end of every year, as render_historical_standings() in generate.py
+  function renderStandings(data) {
+    const standings = data.standings;
+    const table = document.getElementById('historical-standings');
+    if (!standings || !standings.dates.length) {
+      return;
+    }
+    const rows = data.rows;
+    const firstYear = Number(standings.dates[0].slice(0, 4));
+    const lastYear = Number(standings.dates[standings.dates.length - 1].slice(0, 4));
+    const fragment = document.createDocumentFragment();
+    let position = 0;
+    for (let year = firstYear; year <= lastYear; year++) {
+      // ISO dates compare as strings
+      while (position < standings.dates.length && standings.dates[position] <= `${year}-12-31`) {
+        position++;
+      }
+      const board = position ? standings.boards[position - 1] : [];
+      const row = document.createElement('tr');
+      cell(row, year);
+      for (let k = 0; k < data.top_k; k++) {
+        const i = board[k];
+        cell(row, i === undefined ? '–' : `${data.players[rows.player[i]]} (${rows.score[i]})`);
+      }
+      fragment.appendChild(row);
+    }
+    table.replaceChildren(fragment);
+  }
+
+  function render(data) {
+    renderTier(data);
+    renderStandings(data);
+    document.querySelectorAll('table').forEach(table => {
+      const sort = new Tablesort(table);
+    });
+    document.querySelectorAll('input[name="proofFilter"]').forEach(radio => {
+      radio.addEventListener('change', () => renderTier(data));
+    });
+  }
+
+  fetch(dataUrl)
+    .then(response => {
+      if (!response.ok) {
+        throw new Error(`${dataUrl}: ${response.status}`);
+      }
+      return response.json();
+    })
+    .then(render)
+    .catch(error => console.error('Could not load leaderboard data', error));
+})();
@@ -0,0 +1,35 @@
+// Loads the rows left off long tables by generate.py --page-size, one shard per click
+function initializePagination() {
+  document.querySelectorAll('.shard-nav').forEach(nav => {
+    const shards = nav.dataset.shards.split(' ');
+    const tbody = nav.previousElementSibling.querySelector('tbody');
+    const button = nav.querySelector('.load-shard');
+    // Older history goes above the rows shown, lower ranked players below them
+    const position = nav.dataset.position === 'before' ? 'afterbegin' : 'beforeend';
+    let next = 0;
+
+    button.addEventListener('click', () => {
+      button.disabled = true;
+      fetch(shards[next])
+        .then(response => {
+          if (!response.ok) {
+            throw new Error(`${shards[next]}: ${response.status}`);
+          }
+          return response.text();
+        })
+        .then(rows => {
+          tbody.insertAdjacentHTML(position, rows);
+          next++;
+          document.dispatchEvent(new CustomEvent('rowsadded', { detail: { table: tbody.parentElement } }));
+          if (next >= shards.length) {
+            nav.remove();
+          }
+        })
+        .catch(error => console.error('Could not load shard', error))
+        .finally(() => {
+          button.disabled = false;
+        });
+    });
+  });
+}
+document.addEventListener('DOMContentLoaded', initializePagination);
@@ -3,9 +3,11 @@
   const coursesToggle = document.getElementById('coursesToggle');
   const eventsToggle = document.getElementById('eventsToggle');
   const calculatorsToggle = document.getElementById('calculatorsToggle'); // New line
+  const playersToggle = document.getElementById('playersToggle');
   const coursesMenu = document.getElementById('coursesMenu');
   const eventsMenu = document.getElementById('eventsMenu');
   const calculatorsMenu = document.getElementById('calculatorsMenu'); // New line
+  const playersMenu = document.getElementById('playersMenu');
 
   // Toggle sidebar open/close
   menuToggle.addEventListener('click', (e) => {
@@ -44,4 +46,9 @@
   calculatorsToggle.addEventListener('click', () => { // New function
     calculatorsToggle.classList.toggle('active');
     calculatorsMenu.style.display = calculatorsMenu.style.display === 'block' ? 'none' : 'block';
-  });
\ No newline at end of file
+  });
+
+  playersToggle.addEventListener('click', () => {
+    playersToggle.classList.toggle('active');
+    playersMenu.style.display = playersMenu.style.display === 'block' ? 'none' : 'block';
+  });
\ No newline at end of file
@@ -1,6 +1,10 @@
 function initializeFiltering() {
 	const filterRadios = document.querySelectorAll('input[name="proofFilter"]');
-    const allRows = document.querySelectorAll('tbody tr[data-proof]');
+    // The bundled script also runs on pages without a proof filter
+    if (!filterRadios.length) {
+      return;
+    }
+    let allRows = document.querySelectorAll('tbody tr[data-proof]');
     const statsDiv = document.getElementById('stats');
     
     function updateStats(visibleCount, totalCount) {
@@ -30,7 +34,29 @@ function initializeFiltering() {
     
     function filterRecords() {
       const selectedFilter = document.querySelector('input[name="proofFilter"]:checked').value;
+      const tiers = document.querySelectorAll('.proof-tier');
+
+      // Pages with precomputed tables per proof tier only switch sections
+      if (tiers.length) {
+        let visibleCount = 0;
+        let totalCount = 0;
+        tiers.forEach(section => {
+          const rowCount = section.querySelectorAll('tbody tr[data-proof]').length;
+          section.hidden = section.dataset.tier !== selectedFilter;
+          if (!section.hidden) {
+            visibleCount = rowCount;
+          }
+          if (section.dataset.tier === 'all-record') {
+            totalCount = rowCount;
+          }
+        });
+        updateStats(visibleCount, totalCount);
+        return;
+      }
+
       let visibleCount = 0;
+      // Older rows may have been loaded from shards since the last pass
+      allRows = document.querySelectorAll('tbody tr[data-proof]');
       
       allRows.forEach(row => {
         const proofType = row.dataset.proof;
@@ -68,6 +94,7 @@ function initializeFiltering() {
     filterRadios.forEach(radio => {
       radio.addEventListener('change', filterRecords);
     });
+    document.addEventListener('rowsadded', filterRecords);
     filterRecords();
 }
 document.addEventListener('DOMContentLoaded', initializeFiltering);
@@ -0,0 +1,4 @@
+// Makes every table on the page sortable; bundled last so the tables already exist
+document.querySelectorAll('table').forEach(table => {
+  const sort = new Tablesort(table);
+});
@@ -0,0 +1,55 @@
+"""Parsers for the CSV cells: DD/MM/YYYY dates and numbers written with a decimal comma"""
+import calendar
+from collections import namedtuple
+from datetime import date
+from functools import lru_cache
+
+ParseResult = namedtuple('ParseResult', 'value error')
+ParseError = namedtuple('ParseError', 'text reason')
+
+_DIGITS = frozenset('0123456789')
+
+def _is_digits(text):
+    return bool(text) and _DIGITS.issuperset(text)
+
+@lru_cache(maxsize=65536)
+def parse_number_result(value):
+    """Parse a number such as "79,8" or "540", returning a ParseResult"""
+    text = value.strip() if value else ''
+    if not text:
+        return ParseResult(None, ParseError(value, 'empty'))
+    unsigned = text[1:] if text[0] in '+-' else text
+    whole, _, fraction = unsigned.replace(',', '.').partition('.')
+    # Validate the layout up front instead of letting float() raise
+    if (whole or fraction) and (not whole or _is_digits(whole)) and (not fraction or _is_digits(fraction)):
+        return ParseResult(float(text.replace(',', '.')), None)
+    return ParseResult(None, ParseError(value, 'invalid number'))
+
+@lru_cache(maxsize=65536)
+def parse_date_result(value):
+    """Parse a DD/MM/YYYY date, returning a ParseResult"""
+    text = value.strip() if value else ''
+    if not text:
+        return ParseResult(None, ParseError(value, 'empty'))
+    if len(text) == 10 and text[2] == '/' and text[5] == '/':
+        # Fixed-layout fast path, which covers every date in the CSVs
+        day, month, year = text[:2], text[3:5], text[6:]
+    else:
+        parts = text.split('/')
+        if len(parts) != 3 or len(parts[0]) > 2 or len(parts[1]) > 2:
+            return ParseResult(None, ParseError(value, 'invalid date'))
+        day, month, year = parts
+    if not (_is_digits(day) and _is_digits(month) and _is_digits(year) and len(year) == 4):
+        return ParseResult(None, ParseError(value, 'invalid date'))
+    day, month, year = int(day), int(month), int(year)
+    if not (1 <= month <= 12 and 1 <= year and 1 <= day <= calendar.monthrange(year, month)[1]):
+        return ParseResult(None, ParseError(value, 'invalid date'))
+    return ParseResult(date(year, month, day), None)
+
+def parse_number(value):
+    """Parse a number from string, handling commas and empty values"""
+    return parse_number_result(value).value
+
+def parse_date(value):
+    """Parse a date from DD/MM/YYYY format"""
+    return parse_date_result(value).value
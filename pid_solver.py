@@ -0,0 +1,210 @@
+"""Offline, batch version of the search in calculators/PID.html
+
+A Pokémon's PID picks its nature (PID % 25) and, through its last five decimal
+digits, how each Pokéathlon stat swings from day to day. The page tries every
+PID from 0 to 99999 for every day of the month; here the per-day checks are
+folded into 31-bit day masks (see level_masks(), also shipped to the page by
+generate.py) so all PIDs are evaluated at once with NumPy.
+
+Results are the list performCalculation() returns, in the same order.
+"""
+import argparse
+import json
+import math
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    # The rule tables are plain Python; only solve() needs NumPy
+    np = None
+
+STATS = ['Power', 'Stamina', 'Skill', 'Jump', 'Speed']
+FLAVORS = ['Spicy', 'Sour', 'Dry', 'Bitter', 'Sweet']
+
+# Extra stars asked for -> lowest stat bonus that still gives them
+STAR_THRESHOLDS = {4: 120, 3: 80, 2: 40, 1: 15, 0: -14, -1: -39, -2: -100}
+
+NATURE_BONUS = 35
+NATURE_BONUS_LOW = 10
+
+NATURE_NAMES = [
+    "Hardy", "Lonely", "Brave", "Adamant", "Naughty", "Bold", "Docile",
+    "Relaxed", "Impish", "Lax", "Timid", "Hasty", "Serious", "Jolly",
+    "Naive", "Modest", "Mild", "Quiet", "Bashful", "Rash", "Calm",
+    "Gentle", "Sassy", "Careful", "Quirky"
+]
+
+# Stat bonus of each nature, in STATS order
+NATURE_STATS = [
+    [+NATURE_BONUS_LOW, 0, 0, 0, -NATURE_BONUS_LOW],
+    [+NATURE_BONUS, -NATURE_BONUS, 0, 0, 0],
+    [+NATURE_BONUS, 0, 0, 0, -NATURE_BONUS],
+    [+NATURE_BONUS, 0, 0, -NATURE_BONUS, 0],
+    [+NATURE_BONUS, 0, -NATURE_BONUS, 0, 0],
+    [-NATURE_BONUS, +NATURE_BONUS, 0, 0, 0],
+    [0, +NATURE_BONUS_LOW, 0, -NATURE_BONUS_LOW, 0],
+    [0, +NATURE_BONUS, 0, 0, -NATURE_BONUS],
+    [0, +NATURE_BONUS, 0, -NATURE_BONUS, 0],
+    [0, +NATURE_BONUS, -NATURE_BONUS, 0, 0],
+    [-NATURE_BONUS, 0, 0, 0, +NATURE_BONUS],
+    [0, -NATURE_BONUS, 0, 0, +NATURE_BONUS],
+    [0, 0, -NATURE_BONUS_LOW, 0, +NATURE_BONUS_LOW],
+    [0, 0, 0, -NATURE_BONUS, +NATURE_BONUS],
+    [0, 0, -NATURE_BONUS, 0, +NATURE_BONUS],
+    [-NATURE_BONUS, 0, 0, +NATURE_BONUS, 0],
+    [0, -NATURE_BONUS, 0, +NATURE_BONUS, 0],
+    [0, 0, 0, +NATURE_BONUS, -NATURE_BONUS],
+    [-NATURE_BONUS_LOW, 0, 0, +NATURE_BONUS_LOW, 0],
+    [0, 0, -NATURE_BONUS, +NATURE_BONUS, 0],
+    [-NATURE_BONUS, 0, +NATURE_BONUS, 0, 0],
+    [0, -NATURE_BONUS, +NATURE_BONUS, 0, 0],
+    [0, 0, +NATURE_BONUS, 0, -NATURE_BONUS],
+    [0, 0, +NATURE_BONUS, -NATURE_BONUS, 0],
+    [0, -NATURE_BONUS_LOW, +NATURE_BONUS_LOW, 0, 0]
+]
+
+DAYS = range(1, 32)
+PID_COUNT = 100000
+
+def daily_mod(day, stat, digit):
+    """Swing of a stat on a day of the month, from the PID digit of that stat (-9 to +9)"""
+    return (((day + stat + 3) * (day - stat + 7) + digit) % 10) * 2 - 9
+
+def thresholds(stars):
+    """Stat bonus needed for each stat's extra stars"""
+    try:
+        return [STAR_THRESHOLDS[s] for s in stars]
+    except KeyError as e:
+        raise ValueError(f"Invalid star value: {e.args[0]}") from None
+
+def juice_bonus(apricorns):
+    """Stat bonus of the juice blended from the apricorn counts of each flavor
+
+    Ties are broken like the page: the first largest count gets the main bonus,
+    the first largest of the others the second one and the last smallest the malus.
+    """
+    max_value = min_value = apricorns[0]
+    max_idx = min_idx = 0
+    for i in range(1, 5):
+        if apricorns[i] > max_value:
+            max_value, max_idx = apricorns[i], i
+        if apricorns[i] <= min_value:
+            min_value, min_idx = apricorns[i], i
+    second_val, second_idx = -1, -1
+    for i in range(5):
+        if i != max_idx and apricorns[i] > second_val:
+            second_val, second_idx = apricorns[i], i
+
+    juice = [0, 0, 0, 0, 0]
+    juice[max_idx] = math.floor(max_value * 1.5) + 10
+    juice[second_idx] = math.floor(second_val * 1.5)
+    juice[min_idx] = -math.floor((max_value + second_val) * 0.1)
+    return juice
+
+# daily_mod() is 2 * m - 9 for m in 0-9, so any bonus leaves one of 11 levels: a stat passes when m >= level
+LEVELS = 11
+
+def level(need):
+    """Level of a stat that passes on the days its daily_mod() is at least need"""
+    return min(LEVELS - 1, max(0, -(-(need + 9) // 2)))
+
+def level_masks():
+    """Day masks per stat, PID digit and level: bit day-1 is set when the stat passes that day"""
+    return [[[sum(1 << (day - 1) for day in DAYS if daily_mod(day, stat, digit) >= 2 * lvl - 9)
+              for lvl in range(LEVELS)] for digit in range(10)] for stat in range(5)]
+
+def nature_levels(stars, apricorns):
+    """Level of every stat for each nature, given the extra stars wanted and the apricorn counts"""
+    threshold = thresholds(stars)
+    juice = juice_bonus(apricorns)
+    return [[level(threshold[stat] - NATURE_STATS[nature][stat] - juice[stat]) for stat in range(5)]
+            for nature in range(25)]
+
+def pid_index():
+    """The day masks calculators/PID.html looks its answers up in"""
+    return {'days': len(DAYS), 'levels': LEVELS, 'masks': level_masks()}
+
+def _popcount(masks):
+    return _POPCOUNT16[masks & 0xFFFF] + _POPCOUNT16[masks >> 16]
+
+def _day_counts(stars, apricorns):
+    """Viable days of every PID, as an array indexed by PID"""
+    levels = np.array(nature_levels(stars, apricorns))
+    masks = np.full(PID_COUNT, (1 << len(DAYS)) - 1, dtype=np.uint32)
+    for stat in range(5):
+        # One mask per digit and nature, then one gather per PID
+        table = _LEVEL_MASKS[stat][:, levels[:, stat]]
+        masks &= table[_DIGITS[stat], _NATURES]
+    return _popcount(masks)
+
+def best_pids(days):
+    """Replay the page's scan over the day counts: every new best PID, then each other nature reaching it"""
+    results = []
+    running = np.maximum.accumulate(days)
+    previous = np.concatenate(([0], running[:-1]))
+    improvements = np.flatnonzero(days > previous)
+    bounds = list(improvements) + [len(days)]
+    for start, end in zip(bounds, bounds[1:]):
+        best = int(days[start])
+        results.append((int(start), NATURE_NAMES[start % 25], best))
+        # Later PIDs tying the best only count once per nature, the improving one included
+        ties = start + 1 + np.flatnonzero(days[start + 1:end] == best)
+        natures = ties % 25
+        _, first = np.unique(natures, return_index=True)
+        for pid in ties[np.sort(first)]:
+            if pid % 25 != start % 25:
+                results.append((int(pid), NATURE_NAMES[pid % 25], best))
+    return results
+
+def solve(stars, apricorns):
+    """Best PIDs for the extra stars wanted per stat and the apricorn counts per flavor, as (pid, nature, days)"""
+    if np is None:
+        raise RuntimeError("pid_solver.solve requires NumPy")
+    return best_pids(_day_counts(stars, apricorns))
+
+def solve_many(queries):
+    """solve() for each (stars, apricorns) query"""
+    return [solve(stars, apricorns) for stars, apricorns in queries]
+
+if np is not None:
+    _PIDS = np.arange(PID_COUNT)
+    _NATURES = _PIDS % 25
+    # Decimal digits of every PID, least significant first: digit i drives stat i
+    _DIGITS = [(_PIDS // 10 ** i) % 10 for i in range(5)]
+    _LEVEL_MASKS = np.array(level_masks(), dtype=np.uint32)
+    _POPCOUNT16 = np.array([bin(n).count('1') for n in range(1 << 16)], dtype=np.uint8)
+
+def parse_query(line):
+    """A query line: 5 star values then 5 apricorn counts, separated by spaces or commas"""
+    values = [int(v) for v in line.replace(',', ' ').split()]
+    if len(values) != 10:
+        raise ValueError(f"expected 10 values, got {len(values)}")
+    return values[:5], values[5:]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find the best Pokéathlon PIDs, as calculators/PID.html does, for many setups at once")
+    parser.add_argument('queries', nargs='?', default='-', metavar='FILE',
+                        help=f"one query per line: extra stars for {', '.join(STATS)}, then apricorns for {', '.join(FLAVORS)} (default: stdin)")
+    parser.add_argument('--best', action='store_true', help="only print the PIDs with the most viable days")
+    args = parser.parse_args()
+    if np is None:
+        parser.error("pid_solver requires NumPy")
+
+    f = sys.stdin if args.queries == '-' else open(args.queries, encoding='utf-8')
+    for line_num, line in enumerate(f, 1):
+        if not line.strip() or line.startswith('#'):
+            continue
+        try:
+            stars, apricorns = parse_query(line)
+            results = solve(stars, apricorns)
+        except ValueError as e:
+            print(f"Warning: skipping line {line_num}: {e}", file=sys.stderr)
+            continue
+        if args.best and results:
+            results = [r for r in results if r[2] == results[-1][2]]
+        print(json.dumps({
+            'stars': stars,
+            'apricorns': apricorns,
+            'results': [{'pid': pid, 'nature': nature, 'days': days} for pid, nature, days in results]
+        }))
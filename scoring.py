@@ -0,0 +1,81 @@
+"""Pokéathlon points formulas, defined once and used for computation and LaTeX display
+
+Every event awards min(cap, trunc(offset + score * mul / div + num / (score + shift)))
+points, so a formula is just a row of coefficients.
+"""
+from collections import namedtuple
+
+POINTS_CAP = 200
+
+# Goal Roll adds the points for the finishing position: 1st, 2nd, 3rd, 4th
+POSITION_POINTS = (100, 80, 70, 60)
+
+EventFormula = namedtuple('EventFormula', 'offset mul div num shift show_floor offset_label',
+                          defaults=(0, 1, 1, 0, 0, False, None))
+
+EVENT_FORMULAS = {
+    'Hurdle Dash': EventFormula(mul=0, num=11500, show_floor=True),
+    'Pennant Capture': EventFormula(mul=3),
+    'Circle Push': EventFormula(mul=3),
+    'Block Smash': EventFormula(),
+    'Disc Catch': EventFormula(offset=150, mul=0, num=-1500, shift=12.5),
+    'Lamp Jump': EventFormula(div=3.5, show_floor=True),
+    'Relay Run': EventFormula(mul=10),
+    'Ring Drop': EventFormula(mul=1.5),
+    'Snow Throw': EventFormula(mul=3),
+    'Goal Roll': EventFormula(offset=POSITION_POINTS[0], mul=5, offset_label='position_points'),
+}
+
+def _raw_points(formula, score):
+    # Terms are only added when present so the arithmetic matches the hand-written formulas exactly
+    value = formula.offset
+    if formula.mul:
+        value += score * formula.mul / formula.div
+    if formula.num:
+        value += formula.num / (score + formula.shift)
+    return value
+
+def points(event_name, score):
+    """Points awarded for a single raw event score"""
+    return min(POINTS_CAP, int(_raw_points(EVENT_FORMULAS[event_name], score)))
+
+def points_column(event_name, scores):
+    """Points for a whole column of raw scores; None (or an impossible score) gives None"""
+    formula = EVENT_FORMULAS[event_name]
+    column = []
+    for score in scores:
+        if score is None or (formula.num and score + formula.shift == 0):
+            column.append(None)
+        else:
+            column.append(min(POINTS_CAP, int(_raw_points(formula, score))))
+    return column
+
+def _number(value):
+    return f'{value:g}'
+
+def latex(event_name):
+    """MathJax display of an event's points formula"""
+    formula = EVENT_FORMULAS[event_name]
+    score = r'\text{score}'
+    terms = []
+    if formula.offset_label:
+        terms.append(rf'\text{{{formula.offset_label}}}')
+    elif formula.offset:
+        terms.append(_number(formula.offset))
+    if formula.mul:
+        if formula.div != 1:
+            term = rf'\frac{{{score}}}{{{_number(formula.div)}}}'
+        elif formula.mul != 1:
+            term = rf'{score} \times {_number(formula.mul)}'
+        else:
+            term = score
+        terms.append(f'+ {term}' if terms else term)
+    if formula.num:
+        denominator = f'{score} + {_number(formula.shift)}' if formula.shift else score
+        term = rf'\frac{{{_number(abs(formula.num))}}}{{{denominator}}}'
+        sign = '-' if formula.num < 0 else '+'
+        terms.append(f'{sign} {term}' if terms else f'{sign}{term}'.lstrip('+'))
+    expression = ' '.join(terms)
+    if formula.show_floor:
+        expression = rf'\left\lfloor {expression} \right\rfloor'
+    return rf'\( {expression} \)'
@@ -0,0 +1,220 @@
+"""SQLite store of every leaderboard submission, imported incrementally from the CSVs
+
+The CSVs stay the source of truth: ingest() only reads the rows appended since
+the last import (or re-imports a file that was edited in place), and the query
+helpers turn "current WR" and its event breakdown into indexed lookups.
+"""
+import csv
+from datetime import date
+import hashlib
+import io
+import sqlite3
+
+from parsing import parse_date, parse_number
+import scoring
+
+SCHEMA = '''
+PRAGMA foreign_keys = ON;
+
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    csv_file TEXT NOT NULL UNIQUE,
+    digest TEXT,
+    size INTEGER NOT NULL DEFAULT 0,
+    rows INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS leaderboards (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    lower_is_better INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS countries (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    row_num INTEGER NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    country_id INTEGER REFERENCES countries(id),
+    date TEXT,
+    link TEXT NOT NULL DEFAULT '',
+    photo TEXT NOT NULL DEFAULT 'n',
+    UNIQUE (source_id, row_num)
+);
+CREATE TABLE IF NOT EXISTS scores (
+    submission_id INTEGER NOT NULL REFERENCES submissions(id) ON DELETE CASCADE,
+    leaderboard_id INTEGER NOT NULL REFERENCES leaderboards(id) ON DELETE CASCADE,
+    score REAL NOT NULL,
+    points INTEGER,
+    PRIMARY KEY (submission_id, leaderboard_id)
+);
+CREATE TABLE IF NOT EXISTS event_points (
+    submission_id INTEGER NOT NULL REFERENCES submissions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    points REAL,
+    PRIMARY KEY (submission_id, position)
+);
+CREATE INDEX IF NOT EXISTS scores_by_leaderboard ON scores (leaderboard_id, score);
+'''
+
+# Columns shared by every query returning submissions
+_SUBMISSION_COLUMNS = '''
+    l.name AS leaderboard, sub.row_num, p.name AS player, c.name AS country,
+    s.score, s.points, sub.date, sub.link, sub.photo
+'''
+
+_SUBMISSION_JOINS = '''
+    FROM scores s
+    JOIN leaderboards l ON l.id = s.leaderboard_id
+    JOIN submissions sub ON sub.id = s.submission_id
+    JOIN players p ON p.id = sub.player_id
+    LEFT JOIN countries c ON c.id = sub.country_id
+'''
+
+def connect(path):
+    """Open (and create if needed) the store at path"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+def _lookup(conn, table, name, cache):
+    """Id of a players/countries entry, inserting it on first use"""
+    if name not in cache:
+        conn.execute(f'INSERT OR IGNORE INTO {table} (name) VALUES (?)', (name,))
+        cache[name] = conn.execute(f'SELECT id FROM {table} WHERE name = ?', (name,)).fetchone()[0]
+    return cache[name]
+
+def _cell(row, col):
+    return row[col - 1] if col and len(row) >= col else ''
+
+def _import_rows(conn, source_id, spec, rows, first_row_num, leaderboard_ids):
+    players = {}
+    countries = {}
+    imported = 0
+    for row_num, row in enumerate(rows, first_row_num):
+        scores = []
+        for name, (col, _, scored) in spec['leaderboards'].items():
+            score = parse_number(_cell(row, col))
+            if score is None:
+                continue
+            points = None
+            if scored:
+                # Scores no formula can award points for are not records
+                points = scoring.points_column(name, [score])[0]
+                if points is None:
+                    continue
+            scores.append((leaderboard_ids[name], score, points))
+        if not scores:
+            continue
+
+        day = parse_date(_cell(row, spec['date_col']))
+        country = _cell(row, spec.get('country_col')).strip()
+        cursor = conn.execute(
+            'INSERT INTO submissions (source_id, row_num, player_id, country_id, date, link, photo) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (source_id, row_num, _lookup(conn, 'players', row[0].strip(), players),
+             _lookup(conn, 'countries', country, countries) if country else None,
+             day.isoformat() if day else None, _cell(row, spec['link_col']), _cell(row, spec.get('photo_col')) or 'n')
+        )
+        submission_id = cursor.lastrowid
+        conn.executemany('INSERT INTO scores (submission_id, leaderboard_id, score, points) VALUES (?, ?, ?, ?)',
+                         [(submission_id, *score) for score in scores])
+        conn.executemany('INSERT INTO event_points (submission_id, position, event, points) VALUES (?, ?, ?, ?)',
+                         [(submission_id, position, event, parse_number(_cell(row, col)))
+                          for position, (event, col) in enumerate(spec.get('event_points', []), 1)])
+        imported += 1
+    return imported
+
+def ingest(conn, sources):
+    """Import the CSV files described by sources, returning {csv_file: rows imported}
+
+    Each source is a dict with 'csv_file', 'date_col', 'link_col', optional
+    'country_col' and 'photo_col', 'leaderboards' mapping a leaderboard name to
+    (score_col, lower_is_better, scored) and optional 'event_points', a list of
+    (event, col) breakdown columns. Columns are 1-based, as in generate.py.
+    Unchanged files are skipped and appended rows are imported on their own.
+    """
+    imported = {}
+    with conn:
+        for spec in sources:
+            csv_file = spec['csv_file']
+            with open(csv_file, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            source = conn.execute('SELECT id, digest, size, rows FROM sources WHERE csv_file = ?', (csv_file,)).fetchone()
+            if source and source['digest'] == digest:
+                imported[csv_file] = 0
+                continue
+
+            if source is None:
+                source_id = conn.execute('INSERT INTO sources (csv_file) VALUES (?)', (csv_file,)).lastrowid
+            else:
+                source_id = source['id']
+            tail = None
+            if (source is not None and source['size'] and len(data) > source['size']
+                    and hashlib.sha256(data[:source['size']]).hexdigest() == source['digest']):
+                # Only the rows after the previously imported bytes are new
+                tail = data[source['size']:]
+                if data[source['size'] - 1:source['size']] != b'\n':
+                    # The last row imported had no line break yet: appended rows start with one
+                    if tail.startswith(b'\r\n'):
+                        tail = tail[2:]
+                    elif tail.startswith(b'\n'):
+                        tail = tail[1:]
+                    else:
+                        # The last row itself was edited
+                        tail = None
+            if tail is not None:
+                rows = list(csv.reader(io.StringIO(tail.decode('utf-8'), newline='')))
+                first_row_num = source['rows'] + 2
+                total_rows = source['rows'] + len(rows)
+            else:
+                conn.execute('DELETE FROM submissions WHERE source_id = ?', (source_id,))
+                rows = list(csv.reader(io.StringIO(data.decode('utf-8'), newline='')))[1:]
+                first_row_num = 2
+                total_rows = len(rows)
+
+            leaderboard_ids = {}
+            for name, (col, lower_is_better, scored) in spec['leaderboards'].items():
+                conn.execute('INSERT INTO leaderboards (name, source_id, lower_is_better) VALUES (?, ?, ?) '
+                             'ON CONFLICT (name) DO UPDATE SET source_id = excluded.source_id, lower_is_better = excluded.lower_is_better',
+                             (name, source_id, int(lower_is_better)))
+                leaderboard_ids[name] = conn.execute('SELECT id FROM leaderboards WHERE name = ?', (name,)).fetchone()[0]
+
+            imported[csv_file] = _import_rows(conn, source_id, spec, rows, first_row_num, leaderboard_ids)
+            conn.execute('UPDATE sources SET digest = ?, size = ?, rows = ? WHERE id = ?', (digest, len(data), total_rows, source_id))
+    return imported
+
+def _record(row):
+    record = dict(row)
+    record['date'] = date.fromisoformat(record['date']) if record['date'] else None
+    return record
+
+def _best_order(lower_is_better):
+    # Ties keep the earliest submission, as in generate.py
+    return f"s.score {'ASC' if lower_is_better else 'DESC'}, sub.row_num"
+
+def current_record(conn, leaderboard):
+    """Best submission of a leaderboard as a dict, or None"""
+    found = conn.execute('SELECT id, lower_is_better FROM leaderboards WHERE name = ?', (leaderboard,)).fetchone()
+    if found is None:
+        return None
+    row = conn.execute(
+        f'SELECT {_SUBMISSION_COLUMNS}, sub.id AS submission_id {_SUBMISSION_JOINS} '
+        f'WHERE s.leaderboard_id = ? ORDER BY {_best_order(found["lower_is_better"])} LIMIT 1',
+        (found['id'],)
+    ).fetchone()
+    return _record(row) if row else None
+
+def event_breakdown(conn, submission_id):
+    """Per-event points of a course submission, in column order"""
+    return [(row['event'], row['points']) for row in conn.execute(
+        'SELECT event, points FROM event_points WHERE submission_id = ? ORDER BY position', (submission_id,))]